@@ -7,32 +7,55 @@ import { fileURLToPath } from "url";
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-function copyDirectory(src, dest) {
-  if (!fs.existsSync(dest)) {
-    fs.mkdirSync(dest, { recursive: true });
+// Write only when the bytes differ, so unchanged files keep their mtime and
+// Vite's watcher does not reload for them. Changed files are written to a
+// sibling temp file and renamed into place, so a running dev server never
+// serves a half-written module.
+function writeIfChanged(destPath, data) {
+  try {
+    if (
+      fs.statSync(destPath).size === data.length &&
+      fs.readFileSync(destPath).equals(data)
+    ) {
+      return false;
+    }
+  } catch {
+    // Destination does not exist yet
   }
+  const tmpPath = `${destPath}.tmp`;
+  fs.writeFileSync(tmpPath, data);
+  fs.renameSync(tmpPath, destPath);
+  return true;
+}
 
-  const items = fs.readdirSync(src);
+function copyDirectory(src, dest, skip = new Set()) {
+  // recursive mkdir is a no-op for existing directories, so no existsSync probe
+  fs.mkdirSync(dest, { recursive: true });
 
-  for (const item of items) {
+  // Dirents carry the file type from readdir, saving a statSync per entry
+  for (const entry of fs.readdirSync(src, { withFileTypes: true })) {
+    const item = entry.name;
     const srcPath = path.join(src, item);
     const destPath = path.join(dest, item);
-    if (fs.statSync(srcPath).isDirectory()) {
+    if (entry.isDirectory()) {
       // Skip __pycache__ directories
       if (item === "__pycache__") {
         continue;
       }
 
-      copyDirectory(srcPath, destPath);
+      copyDirectory(srcPath, destPath, skip);
       // Create __init__.py in each subdirectory to make it a Python package
       const initPath = path.join(destPath, "__init__.py");
-      if (!fs.existsSync(initPath)) {
-        fs.writeFileSync(initPath, `# Package: ${item}\n`);
+      try {
+        fs.writeFileSync(initPath, `# Package: ${item}\n`, { flag: "wx" });
         console.log(`Created: ${initPath}`);
+      } catch (err) {
+        if (err.code !== "EEXIST") throw err;
+      }
+    } else if (item.endsWith(".py") && !skip.has(srcPath)) {
+      if (writeIfChanged(destPath, fs.readFileSync(srcPath))) {
+        console.log(`Copied: ${srcPath} -> ${destPath}`);
       }
-    } else if (item.endsWith(".py")) {
-      fs.copyFileSync(srcPath, destPath);
-      console.log(`Copied: ${srcPath} -> ${destPath}`);
     }
   }
 }
@@ -42,21 +65,30 @@ function main() {
   const publicBackendDir = path.join(__dirname, "..", "public", "backend");
 
   // Create the destination directory structure
-  if (!fs.existsSync(publicBackendDir)) {
-    fs.mkdirSync(publicBackendDir, { recursive: true });
-  }
+  fs.mkdirSync(publicBackendDir, { recursive: true });
 
   console.log("Copying Python API files to public/backend...");
 
   // Copy all Python files from src/backend to public/backend preserving directory structure
-  copyDirectory(srcApiDir, publicBackendDir);
+  // (the root __init__.py is generated below instead of copied)
+  copyDirectory(
+    srcApiDir,
+    publicBackendDir,
+    new Set([path.join(srcApiDir, "__init__.py")])
+  );
   // Create an __init__.py file in the root to make it a proper Python package
   const initContent = `# API package for Pyodide
 # This directory structure is mirrored from src/backend/
 `;
 
-  fs.writeFileSync(path.join(publicBackendDir, "__init__.py"), initContent);
-  console.log("Created: public/backend/__init__.py");
+  if (
+    writeIfChanged(
+      path.join(publicBackendDir, "__init__.py"),
+      Buffer.from(initContent)
+    )
+  ) {
+    console.log("Created: public/backend/__init__.py");
+  }
 
   console.log("Python API files copied successfully!");
   console.log(`Source: ${srcApiDir}`);
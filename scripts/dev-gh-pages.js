@@ -5,12 +5,11 @@
  */
 
 import { spawn } from "child_process";
-import path from "path";
 
-// Get the repository name for GitHub Pages
-const repo =
-  process.env.GITHUB_REPOSITORY?.split("/")[1] || "react-router-fastapi";
-const basePath = `/${repo}/`;
+import { getRepoBase } from "./get-repo-base.js";
+
+// Get the base path for GitHub Pages
+const basePath = getRepoBase();
 
 console.log(`Starting dev server with GitHub Pages base path: ${basePath}`);
 
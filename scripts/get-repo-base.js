@@ -1,3 +1,13 @@
 // Script to get the repository name for GitHub Pages preview
-const repo = process.env.GITHUB_REPOSITORY?.split('/')[1] || 'react-router-fastapi';
-console.log(`/${repo}/`);
+import { fileURLToPath } from "url";
+
+export function getRepoBase() {
+  const repo =
+    process.env.GITHUB_REPOSITORY?.split("/")[1] || "react-router-fastapi";
+  return `/${repo}/`;
+}
+
+// Print the base path when executed directly
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  console.log(getRepoBase());
+}
@@ -1,7 +1,8 @@
 # Database configuration and utilities
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 try:
     from sqlalchemy.orm import declarative_base
@@ -40,9 +41,36 @@ def get_database_url():
             return DATABASE_URL, ENVIRONMENT
 
 
+def _create_engine(database_url, environment):
+    """Create the engine, tuning SQLite connections for this app's workload"""
+    if not database_url.startswith("sqlite"):
+        return create_engine(database_url)
+
+    engine_kwargs = {"connect_args": {"check_same_thread": False}}
+    if environment == "pyodide-persistent":
+        # Pyodide is single-threaded: share one connection instead of
+        # opening a new one for every get_db() call
+        engine_kwargs["poolclass"] = StaticPool
+    sqlite_engine = create_engine(database_url, **engine_kwargs)
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        # WAL needs shared memory that Emscripten's filesystem lacks, so the
+        # browser build keeps the default rollback journal
+        if environment != "pyodide-persistent":
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+    return sqlite_engine
+
+
 # Initialize database
 DATABASE_URL, ENVIRONMENT = get_database_url()
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = _create_engine(DATABASE_URL, ENVIRONMENT)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
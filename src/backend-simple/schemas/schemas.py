@@ -1,35 +1,42 @@
 # Pydantic schemas for request/response validation
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+# Constrained field types shared across the schemas below
+Name = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+Bio = Annotated[str, StringConstraints(max_length=1000)]
+Title = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+Content = Annotated[str, StringConstraints(min_length=1)]
+Age = Annotated[int, Field(ge=0, le=150)]
 
 
 class UserCreate(BaseModel):
     """Model for creating a new user"""
-    name: str = Field(..., min_length=1, max_length=100)
+    name: Name
     email: str = Field(..., description="Valid email address")
-    age: Optional[int] = Field(None, ge=0, le=150)
-    bio: Optional[str] = Field(None, max_length=1000)
+    age: Optional[Age] = None
+    bio: Optional[Bio] = None
 
 
 class UserUpdate(BaseModel):
     """Model for updating a user"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[Name] = None
     email: Optional[str] = None
-    age: Optional[int] = Field(None, ge=0, le=150)
-    bio: Optional[str] = Field(None, max_length=1000)
+    age: Optional[Age] = None
+    bio: Optional[Bio] = None
     is_active: Optional[bool] = None
 
 
 class PostCreate(BaseModel):
     """Model for creating a new post"""
-    title: str = Field(..., min_length=1, max_length=200)
-    content: str = Field(..., min_length=1)
-    published: bool = Field(False)
+    title: Title
+    content: Content
+    published: bool = False
     author_id: int
 
 
 class PostUpdate(BaseModel):
     """Model for updating a post"""
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    content: Optional[str] = Field(None, min_length=1)
+    title: Optional[Title] = None
+    content: Optional[Content] = None
     published: Optional[bool] = None
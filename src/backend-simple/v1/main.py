@@ -380,11 +380,12 @@ def get_dashboard(
 ):
     """Dashboard with complex mixed SQLAlchemy model response"""
 
-    # Get recent users and posts
+    # Get recent users and posts; rows inserted together share created_at,
+    # so the id breaks ties
     recent_users = db.query(User).order_by(
-        User.created_at.desc()).limit(3).all()
+        User.created_at.desc(), User.id.desc()).limit(3).all()
     recent_posts = db.query(Post).filter(Post.published == True).order_by(
-        Post.created_at.desc()).limit(5).all()
+        Post.created_at.desc(), Post.id.desc()).limit(5).all()
 
     # Get statistics
     total_users = db.query(User).count()
@@ -2,18 +2,36 @@
 import sys
 import os
 from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Type
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+
+
+def _backend_dir() -> str:
+    """Return the backend root (the parent of the app package)."""
+    # __file__ is absolute for normal imports, so plain string slicing
+    # replaces two dirname() calls and abspath()'s getcwd()
+    path = __file__ if os.path.isabs(__file__) else os.path.abspath(__file__)
+    return path.rsplit(os.sep, 2)[0]
+
+
+def _ensure_on_syspath() -> None:
+    """Put the backend root on sys.path."""
+    backend_dir = _backend_dir()
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
 
-# Add current directory to Python path for relative imports
-if __name__ != "__main__":
-    # When imported as a module (e.g., by uvicorn), ensure relative imports work
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
 
 # Import models EARLY to ensure they're available for relationship resolution
-from app.domains.models import User, Post, configure_relationships
+try:
+    from app.domains.models import User, Post, configure_relationships
+except ImportError:
+    # Only runners that start inside app/ (e.g. `python app_main.py`) land
+    # here; Pyodide and package imports never pay for the path fixup
+    _ensure_on_syspath()
+    from app.domains.models import User, Post, configure_relationships
 
 from app.core.settings import settings
 from app.core.logging import setup_logging, get_logger
@@ -23,6 +41,26 @@ from app.api import v1_router
 
 logger = get_logger(__name__)
 
+# App metadata, built once and shared (read-only) by every create_app() call
+_OPENAPI_TAGS = tuple(MappingProxyType(tag) for tag in (
+    {"name": "users", "description": "User management with SQLAlchemy models"},
+    {"name": "posts", "description": "Blog posts with relationships"},
+    {"name": "dashboard", "description": "Complex responses with mixed models"},
+    {"name": "system", "description": "System information and diagnostics"},
+))
+_CORS_ORIGINS = tuple(settings.cors_origins)
+_ALLOW_METHODS = ("*",)
+_ALLOW_HEADERS = ("*",)
+
+
+async def _init_db_pyodide() -> None:
+    """Pyodide has no async SQLite driver, so run the sync initializer."""
+    init_db_sync()
+
+
+# The runtime can't change within a process, so pick the initializer once
+_init_db = _init_db_pyodide if IS_PYODIDE else init_db
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -35,14 +73,9 @@ async def lifespan(app: FastAPI):
     configure_relationships()
 
     try:
-        if IS_PYODIDE:
-            # Use sync initialization for Pyodide
-            init_db_sync()
-        else:
-            # Use async initialization for CPython
-            await init_db()
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        await _init_db()
+    except (SQLAlchemyError, OSError) as e:
+        logger.error("Failed to initialize database: %s", e)
         raise
 
     logger.info("Application startup complete")
@@ -53,6 +86,43 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down application...")
 
 
+def _add_http_middleware(app: FastAPI) -> None:
+    """Install the middleware used when serving real HTTP requests."""
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from app.core.middleware import StaticResponseCacheMiddleware
+
+    # Serve the docs pages and the OpenAPI JSON from memory after their first
+    # render (FastAPI caches the schema dict but re-encodes it per request);
+    # added before CORS so CORS wraps it and still sets headers per request
+    app.add_middleware(
+        StaticResponseCacheMiddleware,
+        paths=(settings.openapi_url, settings.docs_url, settings.redoc_url),
+    )
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=_CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=_ALLOW_METHODS,
+        allow_headers=_ALLOW_HEADERS,
+    )
+
+
+def _default_response_class() -> Type[JSONResponse]:
+    """Use orjson's C encoder for responses when it is installed."""
+    # The bridge serializes Pyodide responses itself, so skip the probe there
+    if not IS_PYODIDE:
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            return ORJSONResponse
+    return JSONResponse
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
 
@@ -65,22 +135,14 @@ def create_app() -> FastAPI:
         docs_url=settings.docs_url,
         redoc_url=settings.redoc_url,
         lifespan=lifespan,
-        openapi_tags=[
-            {"name": "users", "description": "User management with SQLAlchemy models"},
-            {"name": "posts", "description": "Blog posts with relationships"},
-            {"name": "dashboard", "description": "Complex responses with mixed models"},
-            {"name": "system", "description": "System information and diagnostics"},
-        ]
+        openapi_tags=_OPENAPI_TAGS,
+        default_response_class=_default_response_class(),
     )
 
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Pyodide requests reach the handlers through the bridge, never through
+    # the ASGI stack, so middleware (and its imports) is CPython-only
+    if not IS_PYODIDE:
+        _add_http_middleware(app)
 
     # Include API router
     app.include_router(v1_router, prefix=settings.api_v1_prefix)
@@ -92,12 +154,14 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-# For uvicorn compatibility (CPython only)
+# For uvicorn compatibility (CPython only). This runs after the app has been
+# built, so it only starts a development server; run_cpython.py decides
+# between gunicorn and uvicorn before importing the app.
 if __name__ == "__main__":
     if not IS_PYODIDE:
         import uvicorn
         uvicorn.run(
-            "app.main:app",
+            "app.app_main:app",
             host="0.0.0.0",
             port=8000,
             reload=True,
@@ -7,7 +7,7 @@
 #  • Safer serialization with orjson options and bounded _seen handling
 #  • Structured debug traces with size limits (0=compact, 1=full+truncated)
 #  • Deduplicated endpoint registry with direct callable references
-#  • Uvicorn stub with proper UserWarning and help URL
+#  • Uvicorn stub with debug-gated notice and help URL
 #  • Lazy app proxy to handle early imports
 # -----------------------------------------------------------------------------------
 
@@ -20,11 +20,13 @@ import json
 import os
 import sys
 import traceback
-import warnings
-from datetime import date, datetime
+import weakref
+from datetime import date, datetime, time
 from decimal import Decimal
+from enum import Enum
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
 
 __version__ = "0.3.0"
 
@@ -40,33 +42,71 @@ except ImportError:
     def jsonable_encoder(x): return x  # type: ignore
     get_openapi = lambda **kwargs: {}  # type: ignore
 
+# Pyodide FFI, used to convert JavaScript request bodies
 try:
-    from sqlalchemy.orm import DeclarativeMeta
-    # Also import newer registry-based approach for SQLAlchemy 2.x
-    try:
-        from sqlalchemy.orm import registry
-        HAS_SQLALCHEMY_REGISTRY = True
-    except ImportError:
-        HAS_SQLALCHEMY_REGISTRY = False
-except ImportError:
-    DeclarativeMeta = type  # type: ignore
-    HAS_SQLALCHEMY_REGISTRY = False
-
-# Optional orjson for faster serialization
-try:
-    import orjson
-    HAS_ORJSON = True
-    ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+    from pyodide.ffi import JsProxy, to_py  # type: ignore
 except ImportError:
-    HAS_ORJSON = False
-    ORJSON_OPTIONS = 0
+    JsProxy = None  # type: ignore
+    to_py = None  # type: ignore
+
+# Optional SQLAlchemy and orjson support is probed the first time a value that
+# isn't a builtin is serialized (see _load_optional_deps), so failed lookups
+# stay off the import path
+DeclarativeMeta: Any = type
+HAS_SQLALCHEMY_REGISTRY = False
+orjson: Any = None
+HAS_ORJSON = False
+ORJSON_OPTIONS = 0
+_optional_deps_loaded = False
 
 # ---------------------------------------------------------------------------
 # Global state
 # ---------------------------------------------------------------------------
+
+class _EndpointInfo:
+    """Registry record for a single endpoint."""
+    __slots__ = ("path", "method", "operation_id", "summary", "handler", "handler_name",
+                 "is_async")
+
+    def __init__(self, path: str, method: str, operation_id: str, summary: str,
+                 handler: Callable[..., Any]):
+        self.path = path
+        self.method = method
+        self.operation_id = operation_id
+        self.summary = summary
+        self.handler = handler
+        self.handler_name = handler.__name__
+        self.is_async = inspect.iscoroutinefunction(handler)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Transport form returned by get_endpoints()."""
+        return {
+            "path": self.path,
+            "method": self.method,
+            "operationId": self.operation_id,
+            "summary": self.summary,
+            "handler": self.handler_name,
+        }
+
+
 _original_fastapi_class = None
 _app: Optional[Any] = None
-_endpoints_registry: Dict[str, Dict[str, Any]] = {}
+_endpoints_registry: Dict[str, _EndpointInfo] = {}
+# Serializable snapshot served by get_endpoints(), rebuilt on registry mutation
+_endpoints_cache: Optional[List[Dict[str, Any]]] = None
+_endpoints_cache_key: Optional[tuple] = None
+_registry_version = 0
+# Schema served by get_openapi_schema(), keyed on app metadata and routes
+_openapi_cache: Optional[Dict[str, Any]] = None
+_openapi_cache_key: Optional[tuple] = None
+# Endpoint id -> route handler fallback used by execute_endpoint()
+_route_index: Dict[str, Callable[..., Any]] = {}
+_route_index_key: Optional[tuple] = None
+# Handler -> whether it can run through execute_endpoint_sync()
+_sync_handlers: Dict[Callable[..., Any], bool] = {}
+# Dependency callable -> (is_async, is_generator); weak so reloaded user code
+# doesn't keep old dependencies alive
+_dependency_kinds: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 # ---------------------------------------------------------------------------
 # Debug configuration with structured levels
@@ -75,10 +115,17 @@ _endpoints_registry: Dict[str, Dict[str, Any]] = {}
 DEBUG_LEVEL = int(os.getenv("PYODIDE_BRIDGE_DEBUG", "0"))
 
 
-def log(*args: Any, **kwargs: Any) -> None:
-    """Log debug messages if DEBUG_LEVEL > 0."""
-    if DEBUG_LEVEL > 0:
+# DEBUG_LEVEL is fixed at import, so pick the log implementation once
+if DEBUG_LEVEL > 0:
+    def log(*args: Any, **kwargs: Any) -> None:
+        """Log debug messages."""
         print("[PYODIDE_BRIDGE]", *args, **kwargs)
+else:
+    def log(*args: Any, **kwargs: Any) -> None:
+        """Debug logging is disabled (PYODIDE_BRIDGE_DEBUG=0)."""
+
+
+_TRACEBACK_MAX_BYTES = 2048
 
 
 def format_error(e: Exception, include_traceback: bool = False) -> Dict[str, Any]:
@@ -89,19 +136,22 @@ def format_error(e: Exception, include_traceback: bool = False) -> Dict[str, Any
     }
 
     if include_traceback or DEBUG_LEVEL >= 1:
-        # Pre-clip stack depth before formatting to avoid WASM string limits
-        tb_lines = traceback.format_exception(
-            type(e), e, e.__traceback__, limit=20)
-        tb_str = ''.join(tb_lines)
-        # Traceback size guard: truncate to 2 KiB safely to avoid UTF-8 issues
-        if len(tb_str.encode('utf-8')) > 2048:
-            # Safe UTF-8 truncation to avoid breaking multibyte characters
-            truncated = tb_str.encode('utf-8')[:2048].decode('utf-8', 'ignore')
-            error_data["traceback"] = truncated + "..."
-            error_data["traceback_truncated"] = True
-        else:
-            error_data["traceback"] = tb_str
-            error_data["traceback_truncated"] = False
+        # Pre-clip stack depth before formatting to avoid WASM string limits,
+        # and stop formatting once the 2 KiB size guard is reached
+        buf = bytearray()
+        truncated = False
+        tb = traceback.TracebackException(type(e), e, e.__traceback__, limit=20)
+        for line in tb.format():
+            encoded = line.encode('utf-8')
+            if len(buf) + len(encoded) > _TRACEBACK_MAX_BYTES:
+                buf += encoded[:_TRACEBACK_MAX_BYTES - len(buf)]
+                truncated = True
+                break
+            buf += encoded
+        # Safe UTF-8 decoding to avoid breaking multibyte characters
+        tb_str = buf.decode('utf-8', 'ignore')
+        error_data["traceback"] = tb_str + "..." if truncated else tb_str
+        error_data["traceback_truncated"] = truncated
 
     return error_data
 
@@ -172,58 +222,83 @@ _apply_early_monkey_patch()
 # ---------------------------------------------------------------------------
 
 
+_api_prefix: Optional[str] = None
+
+
+def _get_api_prefix() -> str:
+    """Resolve the API prefix for router endpoints once per process.
+
+    Only a prefix read from settings is cached; while settings can't be
+    imported the default is returned and the import is retried next time.
+    """
+    global _api_prefix
+    if _api_prefix is None:
+        # Try to get the API prefix from settings
+        try:
+            from app.core.settings import settings
+            _api_prefix = settings.api_v1_prefix
+        except Exception:
+            # Fallback to default prefix if settings unavailable
+            return "/api/v1"
+    return _api_prefix
+
+
+class _RouterMethod:
+    """Descriptor installed as ``APIRouter.get``/``post``/... to record endpoints."""
+    __slots__ = ("orig", "method")
+
+    def __init__(self, orig: Callable[..., Any], method: str):
+        self.orig = orig
+        self.method = method
+
+    def __get__(self, router: Any, owner: Any = None):
+        if router is None:
+            return self
+        return functools.partial(self._bound, router)
+
+    def _bound(self, router: Any, path: str, **kwargs: Any) -> "_RouterRouteInner":
+        return _RouterRouteInner(self, router, path, kwargs)
+
+
+class _RouterRouteInner:
+    """Decorator returned by a patched APIRouter method for a single path."""
+    __slots__ = ("deco", "router", "path", "kwargs")
+
+    def __init__(self, deco: _RouterMethod, router: Any, path: str, kwargs: Dict[str, Any]):
+        self.deco = deco
+        self.router = router
+        self.path = path
+        self.kwargs = kwargs
+
+    def __call__(self, func: Callable[..., Any]):
+        deco = self.deco
+        router = self.router
+        path = self.path
+
+        if _app is not None and router is getattr(_app, "router", None):
+            # app.get() etc. land here via FastAPI; the route was already
+            # registered unprefixed by _RouteInner
+            return deco.orig(router, path, **self.kwargs)(func)
+
+        if DEBUG_LEVEL:
+            log(f"Registering {deco.method} {path} → {func.__name__} (router)")
+
+        # Register in our global registry with full path including prefix
+        _register_endpoint(_get_api_prefix() + path, deco.method, func, self.kwargs)
+
+        # Call original method
+        return deco.orig(router, path, **self.kwargs)(func)
+
+
 def _patch_router_class():
     """Patch APIRouter class to intercept route registrations."""
     try:
         from fastapi import APIRouter
 
-        # Store original methods
-        original_get = APIRouter.get
-        original_post = APIRouter.post
-        original_put = APIRouter.put
-        original_patch = APIRouter.patch
-        original_delete = APIRouter.delete
-
-        def make_router_wrapper(orig_method: callable, method: str):
-            def wrapper(self, path: str, **kwargs):
-                def inner(func: callable):
-                    log(f"Registering {method} {path} → {func.__name__} (router)")
-
-                    # Register in our global registry with full path including prefix
-                    operation_id = kwargs.get("operation_id") or func.__name__
-
-                    # Try to get the API prefix from settings
-                    full_path = path
-                    try:
-                        from app.core.settings import settings
-                        full_path = settings.api_v1_prefix + path
-                    except Exception:
-                        # Fallback to default prefix if settings unavailable
-                        full_path = "/api/v1" + path
-
-                    info = {
-                        "path": full_path,
-                        "method": method,
-                        "operationId": operation_id,
-                        "summary": kwargs.get("summary") or func.__doc__ or f"{method} {path}",
-                        "handler": func,
-                    }
-
-                    _endpoints_registry[operation_id] = info
-                    log(
-                        f"Registered router endpoint: {operation_id} at {full_path}")
-
-                    # Call original method
-                    return orig_method(self, path, **kwargs)(func)
-                return inner
-            return wrapper
-
-        # Patch router methods
-        APIRouter.get = make_router_wrapper(original_get, "GET")
-        APIRouter.post = make_router_wrapper(original_post, "POST")
-        APIRouter.put = make_router_wrapper(original_put, "PUT")
-        APIRouter.patch = make_router_wrapper(original_patch, "PATCH")
-        APIRouter.delete = make_router_wrapper(original_delete, "DELETE")
+        # Install descriptors once on the class; they wrap the original methods
+        for method in ("get", "post", "put", "patch", "delete"):
+            setattr(APIRouter, method, _RouterMethod(
+                getattr(APIRouter, method), method.upper()))
 
         log("✅ Router class patching applied successfully")
 
@@ -239,26 +314,50 @@ _patch_router_class()
 # ---------------------------------------------------------------------------
 
 
+def _inspect_dependency_kind(dependency: Callable[..., Any]) -> Tuple[bool, bool]:
+    call = getattr(dependency, "__call__", None)
+    return (
+        inspect.iscoroutinefunction(dependency),
+        inspect.isgeneratorfunction(dependency) or inspect.isgeneratorfunction(call),
+    )
+
+
+def _dependency_kind(dependency: Callable[..., Any]) -> Tuple[bool, bool]:
+    """Return ``(is_async, is_generator)`` for a dependency callable."""
+    try:
+        kind = _dependency_kinds.get(dependency)
+    except TypeError:
+        # Unhashable or not weak-referenceable callables aren't cached
+        return _inspect_dependency_kind(dependency)
+    if kind is None:
+        kind = _dependency_kinds[dependency] = _inspect_dependency_kind(dependency)
+    return kind
+
+
+def _call_sync_dependency(dependency: Callable[..., Any], is_generator: bool) -> Any:
+    """Call a sync dependency, taking the first value a generator yields."""
+    result = dependency()
+    if is_generator:
+        try:
+            return next(result)
+        except StopIteration as exc:
+            return exc.value
+    return result
+
+
 class _DependsShim:
-    __slots__ = ("dependency",)
+    __slots__ = ("dependency", "use_cache", "is_async", "is_generator")
 
-    def __init__(self, dependency: Callable[..., Any]):
+    def __init__(self, dependency: Callable[..., Any], use_cache: bool = True):
         self.dependency = dependency
+        self.use_cache = use_cache
+        self.is_async, self.is_generator = _dependency_kind(dependency)
 
     async def resolve(self) -> Any:
         """Resolve dependency, handling both sync and async functions."""
-        if inspect.iscoroutinefunction(self.dependency):
+        if self.is_async:
             return await self.dependency()
-        else:
-            result = self.dependency()
-            # Handle generators
-            import types
-            if isinstance(result, types.GeneratorType) or hasattr(result, "__next__"):
-                try:
-                    return next(result)
-                except StopIteration as exc:
-                    return exc.value
-            return result
+        return _call_sync_dependency(self.dependency, self.is_generator)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.dependency(*args, **kwargs)
@@ -268,8 +367,8 @@ class _DependsShim:
 
 
 class _DependsMeta(type):
-    def __call__(cls, dependency: Callable[..., Any], **_kwargs: Any):
-        return _DependsShim(dependency)
+    def __call__(cls, dependency: Callable[..., Any], *, use_cache: bool = True, **_kwargs: Any):
+        return _DependsShim(dependency, use_cache)
 
     def __instancecheck__(cls, instance: Any) -> bool:
         return isinstance(instance, _DependsShim)
@@ -283,17 +382,49 @@ class Depends(metaclass=_DependsMeta):
 # ---------------------------------------------------------------------------
 
 
-def _is_sqlalchemy_model(obj: Any) -> bool:
+def _load_optional_deps() -> None:
+    """Resolve the optional SQLAlchemy and orjson imports once."""
+    global DeclarativeMeta, HAS_SQLALCHEMY_REGISTRY, orjson, HAS_ORJSON, ORJSON_OPTIONS
+    global _optional_deps_loaded
+
+    if _optional_deps_loaded:
+        return
+    _optional_deps_loaded = True
+
+    try:
+        from sqlalchemy.orm import DeclarativeMeta as _DeclarativeMeta
+        DeclarativeMeta = _DeclarativeMeta
+        # Also import newer registry-based approach for SQLAlchemy 2.x
+        try:
+            from sqlalchemy.orm import registry  # noqa: F401
+            HAS_SQLALCHEMY_REGISTRY = True
+        except ImportError:
+            pass
+    except ImportError:
+        pass
+
+    # Optional orjson for faster serialization
+    try:
+        import orjson as _orjson
+        orjson = _orjson
+        HAS_ORJSON = True
+        # Dataclasses are serialized natively rather than stringified via default=
+        ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+    except ImportError:
+        pass
+
+
+def _class_is_sqlalchemy(cls: type) -> bool:
     """Accurate SQLAlchemy model detection using DeclarativeMeta and registry approach."""
     try:
         # Primary check: DeclarativeMeta (works for both SQLAlchemy 1.x and 2.x)
-        if isinstance(obj.__class__, DeclarativeMeta):
+        if isinstance(cls, DeclarativeMeta):
             return True
 
         # Additional check for newer registry-based approach (SQLAlchemy 2.x)
         if HAS_SQLALCHEMY_REGISTRY:
-            # Check if object has SQLAlchemy registry metadata
-            if hasattr(obj, '__table__') and hasattr(obj, '__mapper__'):
+            # Check if the class has SQLAlchemy registry metadata
+            if hasattr(cls, '__table__') and hasattr(cls, '__mapper__'):
                 return True
 
         return False
@@ -301,58 +432,112 @@ def _is_sqlalchemy_model(obj: Any) -> bool:
         return False
 
 
-def convert_to_serializable(obj: Any, _seen: Optional[set[int]] = None) -> Any:
-    """Enhanced serialization with bounded circular reference handling."""
-    # Always use a fresh set per call to avoid shared state between concurrent requests
-    if _seen is None:
-        _seen = set()
+# Per-class probe results for convert_to_serializable:
+# (has model_dump, has dict, is SQLAlchemy model)
+_class_traits: Dict[type, tuple] = {}
+
+
+def _get_class_traits(cls: type) -> tuple:
+    """Probe a class once; every later instance reuses the answer."""
+    traits = _class_traits.get(cls)
+    if traits is None:
+        # First non-builtin value: payloads made only of dicts, lists and
+        # scalars never import SQLAlchemy or orjson
+        _load_optional_deps()
+        traits = (hasattr(cls, "model_dump"), hasattr(cls, "dict"),
+                  _class_is_sqlalchemy(cls))
+        _class_traits[cls] = traits
+    return traits
+
+
+# Column names per mapped class, read from __table__ once per class
+_column_names: Dict[type, tuple] = {}
+
+
+def _get_column_names(cls: type) -> tuple:
+    """Return the table column names of a SQLAlchemy mapped class."""
+    names = _column_names.get(cls)
+    if names is None:
+        names = tuple(col.name for col in cls.__table__.columns)
+        _column_names[cls] = names
+    return names
+
+
+# Exact types that are already JSON-ready (subclasses like IntEnum are not)
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def convert_to_serializable(obj: Any) -> Any:
+    """Enhanced serialization with bounded circular reference handling.
+
+    Containers and objects are tracked by ``id()`` while they are being
+    walked, so reference cycles (e.g. ORM back-references) become
+    ``"<circular>"`` instead of recursing.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    return _convert(obj, set())
+
+
+def _convert(obj: Any, seen: set[int]) -> Any:
+    """Serialization walk behind convert_to_serializable()."""
+    # Leaves first - they can't form cycles, so skip the bookkeeping
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
 
     oid = id(obj)
-    if oid in _seen:
+    if oid in seen:
         return "<circular>"
-
     # Add to seen set with try/finally for memory control
-    _seen.add(oid)
+    seen.add(oid)
     try:
-        # Primitives first
-        if obj is None or isinstance(obj, (bool, int, float, str)):
-            return obj
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return float(obj)
-
-        # Collections
+        if isinstance(obj, Enum):
+            return _convert(obj.value, seen)
+
+        # Collections - JSON scalar items are copied without a recursive call
         if isinstance(obj, dict):
-            return {k: convert_to_serializable(v, _seen) for k, v in obj.items()}
+            return {k: v if type(v) in _JSON_SCALARS else _convert(v, seen)
+                    for k, v in obj.items()}
         if isinstance(obj, (list, tuple, set)):
-            return [convert_to_serializable(v, _seen) for v in obj]
+            return [v if type(v) in _JSON_SCALARS else _convert(v, seen)
+                    for v in obj]
+
+        has_model_dump, has_dict, is_sqlalchemy = _get_class_traits(type(obj))
 
         # Pydantic BaseModel (v2 preferred, v1 fallback)
-        if hasattr(obj, "model_dump"):
+        if has_model_dump:
             try:
-                if hasattr(obj, "model_dump_json") and HAS_ORJSON:
-                    return orjson.loads(obj.model_dump_json())
-                return convert_to_serializable(obj.model_dump(), _seen)
+                # JSON-ready values in one pass, without a JSON text round trip
+                return obj.model_dump(mode="json")
             except Exception:
                 pass
-        if hasattr(obj, "dict"):
             try:
-                return convert_to_serializable(obj.dict(), _seen)
+                return _convert(obj.model_dump(), seen)
+            except Exception:
+                pass
+        if has_dict:
+            try:
+                return _convert(obj.dict(), seen)
             except Exception:
                 pass
 
         # SQLAlchemy model with accurate detection
-        if _is_sqlalchemy_model(obj):
+        if is_sqlalchemy:
             data: Dict[str, Any] = {}
             try:
-                for col in getattr(obj, "__table__").columns:
-                    data[col.name] = convert_to_serializable(
-                        getattr(obj, col.name, None), _seen)
+                for name in _get_column_names(type(obj)):
+                    data[name] = _convert(
+                        getattr(obj, name, None), seen)
                 # Add relationships from __dict__
                 for k, v in obj.__dict__.items():
                     if not k.startswith("_") and k not in data:
-                        data[k] = convert_to_serializable(v, _seen)
+                        data[k] = _convert(v, seen)
                 return data
             except Exception as e:
                 log(f"SQLAlchemy serialization error: {e}")
@@ -367,28 +552,48 @@ def convert_to_serializable(obj: Any, _seen: Optional[set[int]] = None) -> Any:
             return str(obj)
     finally:
         # Remove from seen set to bound memory growth
-        _seen.discard(oid)
+        seen.discard(oid)
 
 # ---------------------------------------------------------------------------
 # Route decorator patching with async support
 # ---------------------------------------------------------------------------
 
 
+class _RouteDecorator:
+    """Stand-in for ``app.get``/``app.post``/... that records endpoints."""
+    __slots__ = ("orig", "method")
+
+    def __init__(self, orig: Callable[..., Any], method: str):
+        self.orig = orig
+        self.method = method
+
+    def __call__(self, path: str, **kwargs: Any) -> "_RouteInner":
+        return _RouteInner(self, path, kwargs)
+
+
+class _RouteInner:
+    """Decorator returned by ``_RouteDecorator`` for a single path."""
+    __slots__ = ("deco", "path", "kwargs")
+
+    def __init__(self, deco: _RouteDecorator, path: str, kwargs: Dict[str, Any]):
+        self.deco = deco
+        self.path = path
+        self.kwargs = kwargs
+
+    def __call__(self, func: Callable[..., Any]):
+        deco = self.deco
+        if DEBUG_LEVEL:
+            log(f"Registering {deco.method} {self.path} → {func.__name__}")
+        wrapped = _make_dependency_wrapper(func)
+        _register_endpoint(self.path, deco.method, func, self.kwargs)
+        return deco.orig(self.path, **self.kwargs)(wrapped)
+
+
 def _patch_route_decorators(app: Any) -> None:
     """Patch HTTP method decorators to support async handlers."""
-    def make_wrapper(orig: Callable[..., Any], method: str):
-        def decorator(path: str, **kwargs):
-            def inner(func: Callable[..., Any]):
-                log(f"Registering {method} {path} → {func.__name__}")
-                wrapped = _make_dependency_wrapper(func)
-                _register_endpoint(path, method, func, kwargs)
-                return orig(path, **kwargs)(wrapped)
-            return inner
-        return decorator
-
     for method in ("get", "post", "put", "patch", "delete"):
         if hasattr(app, method):
-            setattr(app, method, make_wrapper(
+            setattr(app, method, _RouteDecorator(
                 getattr(app, method), method.upper()))
 
 # ---------------------------------------------------------------------------
@@ -396,97 +601,160 @@ def _patch_route_decorators(app: Any) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Parameter plans per callable: one (name, annotation, default) tuple per
+# parameter, so requests never call inspect.signature()
+_param_plans: Dict[Callable[..., Any], tuple] = {}
+
+
+# Parameter kinds recorded in a plan, decided once from the default value
+_PARAM_REQUIRED = 0   # no default: filled from the request or the body
+_PARAM_DEPENDS = 1    # Depends(...)
+_PARAM_FIELD = 2      # FastAPI Query(), Path(), etc. holding .default
+_PARAM_VALUE = 3      # plain default value
+
+
+def _param_kind(default: Any) -> int:
+    """Classify a parameter default for _prepare_handler_kwargs."""
+    if default is inspect.Parameter.empty:
+        return _PARAM_REQUIRED
+    if isinstance(default, _DependsShim) or hasattr(default, "dependency"):
+        return _PARAM_DEPENDS
+    try:
+        if hasattr(default, 'default') and not callable(default):
+            return _PARAM_FIELD
+    except Exception as e:
+        log(f"Error classifying default {default!r}: {e}")
+    return _PARAM_VALUE
+
+
+def _get_param_plan(func: Callable[..., Any]) -> tuple:
+    """Return the cached ``(name, annotation, default, kind)`` plan for func."""
+    plan = _param_plans.get(func)
+    if plan is None:
+        plan = tuple((name, param.annotation, param.default, _param_kind(param.default))
+                     for name, param in inspect.signature(func).parameters.items())
+        _param_plans[func] = plan
+    return plan
+
+
+def _plain_fallback(default: Any) -> Any:
+    """Value for a non-dependency parameter the request did not supply."""
+    if default is inspect.Parameter.empty:
+        return None
+    # FastAPI Query(), Path(), etc. carry the real default on .default
+    return default.default if hasattr(default, "default") else default
+
+
+def _plain_fallbacks(plan: tuple) -> Optional[Dict[str, Any]]:
+    """Precompute per-parameter fallbacks if func declares no dependencies.
+
+    Resolution then reduces to "request value, else fallback", which the
+    wrappers do in one dict comprehension instead of walking the plan.
+    """
+    for _name, _annotation, _default, kind in plan:
+        if kind == _PARAM_DEPENDS:
+            return None
+    return {name: _plain_fallback(default) for name, _annotation, default, _kind in plan}
+
+
+def _copy_endpoint_attrs(wrapper: Callable[..., Any], func: Callable[..., Any],
+                         sig: inspect.Signature) -> None:
+    """Copy only what FastAPI reads from an endpoint onto its wrapper.
+
+    The name and docstring feed route names and OpenAPI descriptions, and the
+    precomputed signature is what FastAPI introspects for parameters.
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func  # type: ignore
+    wrapper.__signature__ = sig  # type: ignore
+
+
 def _make_dependency_wrapper(func: Callable[..., Any]):
     """Wrap function to handle dependencies and async execution."""
     sig = inspect.signature(func)
+    plan = _get_param_plan(func)
+    fallbacks = _plain_fallbacks(plan)
     is_async = inspect.iscoroutinefunction(func)
 
     if is_async:
         async def async_wrapper(**request_kwargs):
-            resolved = await _resolve_dependencies(sig, request_kwargs, is_sync_context=False)
+            if fallbacks is not None:
+                resolved = {name: request_kwargs.get(name, value)
+                            for name, value in fallbacks.items()}
+            else:
+                resolved = await _resolve_dependencies(plan, request_kwargs, is_sync_context=False)
             return await func(**resolved)
 
-        functools.update_wrapper(async_wrapper, func)
-        async_wrapper.__signature__ = sig  # type: ignore
+        _copy_endpoint_attrs(async_wrapper, func, sig)
         return async_wrapper
     else:
         def sync_wrapper(**request_kwargs):
-            # Handle dependencies synchronously - check for async deps
-            resolved = _resolve_dependencies_sync(sig, request_kwargs)
+            if fallbacks is not None:
+                resolved = {name: request_kwargs.get(name, value)
+                            for name, value in fallbacks.items()}
+            else:
+                # Handle dependencies synchronously - check for async deps
+                resolved = _resolve_dependencies_sync(plan, request_kwargs)
             result = func(**resolved)
             return convert_to_serializable(result)
 
-        functools.update_wrapper(sync_wrapper, func)
-        sync_wrapper.__signature__ = sig  # type: ignore
+        _copy_endpoint_attrs(sync_wrapper, func, sig)
         return sync_wrapper
 
 
-def _resolve_dependencies_sync(sig: inspect.Signature, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+def _resolve_dependencies_sync(plan: tuple, request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """Resolve dependencies synchronously, raising error for async deps."""
     resolved: Dict[str, Any] = {}
 
-    for name, param in sig.parameters.items():
-        default = param.default
+    for name, _annotation, default, _kind in plan:
 
-        if isinstance(default, _DependsShim):
+        if name in request_kwargs:
+            # Already resolved for this request by execute_endpoint
+            resolved[name] = request_kwargs[name]
+        elif isinstance(default, _DependsShim):
             # Check for async dependency in sync context
-            if inspect.iscoroutinefunction(default.dependency):
+            if default.is_async:
                 raise HTTPException(
                     500, f"Cannot use async dependency '{name}' in sync handler")
             else:
                 try:
-                    result = default.dependency()
-                    if hasattr(result, '__next__'):  # Generator
-                        try:
-                            resolved[name] = next(result)
-                        except StopIteration as exc:
-                            resolved[name] = exc.value
-                    else:
-                        resolved[name] = result
+                    resolved[name] = _call_sync_dependency(
+                        default.dependency, default.is_generator)
                 except Exception as e:
                     log(f"Error resolving dependency {name}: {e}")
                     resolved[name] = None
-        elif name in request_kwargs:
-            resolved[name] = request_kwargs[name]
-        elif param.default is not inspect.Parameter.empty:
+        elif default is not inspect.Parameter.empty:
             # Handle FastAPI Query, Path, etc parameters
-            if hasattr(param.default, 'default'):
-                resolved[name] = param.default.default
+            if hasattr(default, 'default'):
+                resolved[name] = default.default
             else:
-                resolved[name] = param.default
+                resolved[name] = default
         else:
             resolved[name] = None
 
     return resolved
 
 
-async def _resolve_dependencies(sig: inspect.Signature, request_kwargs: Dict[str, Any], is_sync_context: bool = False) -> Dict[str, Any]:
+async def _resolve_dependencies(plan: tuple, request_kwargs: Dict[str, Any], is_sync_context: bool = False) -> Dict[str, Any]:
     """Resolve function dependencies, handling both sync and async."""
     resolved: Dict[str, Any] = {}
 
-    for name, param in sig.parameters.items():
-        default = param.default
+    for name, _annotation, default, _kind in plan:
 
-        if isinstance(default, _DependsShim):
+        if name in request_kwargs:
+            # Already resolved for this request by execute_endpoint
+            resolved[name] = request_kwargs[name]
+        elif isinstance(default, _DependsShim):
             resolved[name] = await default.resolve()
         elif hasattr(default, "dependency"):
             # Handle original FastAPI Depends
             dep = default.dependency
-            if inspect.iscoroutinefunction(dep):
+            is_async, is_generator = _dependency_kind(dep)
+            if is_async:
                 resolved[name] = await dep()
             else:
-                result = dep()
-                # Handle generators
-                import types
-                if isinstance(result, types.GeneratorType) or hasattr(result, "__next__"):
-                    try:
-                        resolved[name] = next(result)
-                    except StopIteration as exc:
-                        resolved[name] = exc.value
-                else:
-                    resolved[name] = result
-        elif name in request_kwargs:
-            resolved[name] = request_kwargs[name]
+                resolved[name] = _call_sync_dependency(dep, is_generator)
         elif hasattr(default, "default"):
             resolved[name] = default.default
         else:
@@ -500,20 +768,111 @@ async def _resolve_dependencies(sig: inspect.Signature, request_kwargs: Dict[str
 
 
 def _register_endpoint(path: str, method: str, func: Callable[..., Any], decorator_kwargs: Dict[str, Any]):
-    """Register endpoint in deduplicated registry with direct callable reference."""
+    """Register endpoint in deduplicated registry with direct callable reference.
+
+    This is the single place the operation id and summary fallbacks are
+    resolved, for both app-level and APIRouter registrations.
+    """
     operation_id = decorator_kwargs.get("operation_id") or func.__name__
 
-    info = {
-        "path": path,
-        "method": method,
-        "operationId": operation_id,
-        "summary": decorator_kwargs.get("summary") or func.__doc__ or f"{method} {path}",
-        "handler": func,  # Store direct callable instead of name
-    }
+    info = _EndpointInfo(
+        path, method, operation_id,
+        decorator_kwargs.get("summary") or func.__doc__ or f"{method} {path}",
+        func,  # Store direct callable instead of name
+    )
 
     # Overwrite if already exists (deduplication)
+    _store_endpoint(operation_id, info)
+    if DEBUG_LEVEL:
+        log(f"Registered endpoint: {operation_id}")
+
+
+def _store_endpoint(operation_id: str, info: _EndpointInfo) -> None:
+    """Insert a registry record and invalidate the get_endpoints() snapshot."""
+    global _endpoints_cache, _registry_version
     _endpoints_registry[operation_id] = info
-    log(f"Registered endpoint: {operation_id}")
+    _registry_version += 1
+    _endpoints_cache = None
+
+# '/' -> '_', braces dropped: "/users/{user_id}" -> "_users_user_id"
+_ENDPOINT_ID_TABLE = str.maketrans({'/': '_', '{': None, '}': None})
+
+
+def _make_endpoint_id(method: str, path: str) -> str:
+    """Endpoint id for a route without an explicit operation id."""
+    path_normalized = path.translate(_ENDPOINT_ID_TABLE)
+    if path_normalized.startswith('_'):
+        # Remove leading underscore only
+        path_normalized = path_normalized[1:]
+    return f"{method}__{path_normalized}"
+
+
+def _route_endpoint_ids(route: Any) -> Tuple[Tuple[str, str], ...]:
+    """Return ``(method, endpoint_id)`` pairs for a FastAPI route.
+
+    The ids are derived from the route path once and stored on the route as
+    ``_bridge_endpoint_ids``; non-HTTP routes yield nothing.
+    """
+    cached = getattr(route, "_bridge_endpoint_ids", None)
+    if cached is not None:
+        return cached
+
+    ids: Tuple[Tuple[str, str], ...] = ()
+    if hasattr(route, 'methods') and hasattr(route, 'path'):
+        ids = tuple(
+            (method.upper(), _make_endpoint_id(method.upper(), route.path))
+            for method in route.methods
+            # Skip auto-generated methods
+            if method.upper() not in ('HEAD', 'OPTIONS')
+        )
+    try:
+        route._bridge_endpoint_ids = ids
+    except AttributeError:
+        pass
+    return ids
+
+class _RoutesSnapshot:
+    """Cache-key part that equals only a snapshot of the very same routes.
+
+    Routes are compared by identity, so swapping a route for another of the
+    same shape still invalidates; holding them keeps their ids from being
+    reused while the snapshot is cached.
+    """
+    __slots__ = ("routes",)
+
+    def __init__(self, routes: Any):
+        self.routes = tuple(routes)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, _RoutesSnapshot):
+            return NotImplemented
+        return len(self.routes) == len(other.routes) and all(
+            a is b for a, b in zip(self.routes, other.routes))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _get_route_index() -> Dict[str, Callable[..., Any]]:
+    """Map endpoint ids to route handlers, rebuilt only when the routes change.
+
+    Used when the registry misses; the first route claiming an id wins, as
+    with the linear scan it replaces.
+    """
+    global _route_index, _route_index_key
+
+    routes = getattr(_app, "routes", None) if _app is not None else None
+    if routes is None:
+        return {}
+
+    cache_key = (id(_app), _RoutesSnapshot(routes))
+    if _route_index_key != cache_key:
+        index: Dict[str, Callable[..., Any]] = {}
+        for route in routes:
+            for _method, endpoint_id in _route_endpoint_ids(route):
+                index.setdefault(endpoint_id, route.endpoint)
+        _route_index = index
+        _route_index_key = cache_key
+    return _route_index
 
 # ---------------------------------------------------------------------------
 # Public API functions
@@ -521,54 +880,73 @@ def _register_endpoint(path: str, method: str, func: Callable[..., Any], decorat
 
 
 def get_endpoints() -> List[Dict[str, Any]]:
-    """Return list of registered endpoints."""
+    """Return list of registered endpoints.
+
+    The list is cached and only rebuilt when the registry or the app routes
+    change, so callers must treat it as read-only.
+    """
+    global _endpoints_cache, _endpoints_cache_key
+
+    routes = getattr(_app, "routes", None) if _app is not None else None
+    # The registry can also be cleared from outside (bridge reset), so the
+    # key tracks its size alongside the mutation counter
+    cache_key = (_registry_version, len(_endpoints_registry),
+                 id(_app), _RoutesSnapshot(routes or ()))
+    if _endpoints_cache is not None and _endpoints_cache_key == cache_key:
+        return _endpoints_cache
+
     # First try to get from registry (for endpoints registered through our decorators)
-    result = []
-    for endpoint in _endpoints_registry.values():
-        endpoint_copy = endpoint.copy()
-        if callable(endpoint_copy["handler"]):
-            endpoint_copy["handler"] = endpoint_copy["handler"].__name__
-        result.append(endpoint_copy)
+    result = [endpoint.as_dict() for endpoint in _endpoints_registry.values()]
 
     # If registry is empty, read directly from FastAPI app routes
     if not result and _app is not None and hasattr(_app, 'routes'):
         for route in _app.routes:
-            if hasattr(route, 'methods') and hasattr(route, 'path'):
-                # This is a regular route (not WebSocket, etc.)
-                for method in route.methods:
-                    if method.upper() not in ('HEAD', 'OPTIONS'):  # Skip auto-generated methods
-                        # Generate operation ID properly
-                        path_normalized = route.path.replace(
-                            '/', '_').replace('{', '').replace('}', '')
-                        if path_normalized.startswith('_'):
-                            # Remove leading underscore only
-                            path_normalized = path_normalized[1:]
-                        endpoint_id = f"{method.upper()}__{path_normalized}"
-
-                        endpoint_info = {
-                            'operationId': endpoint_id,
-                            'method': method.upper(),
-                            'path': route.path,
-                            'summary': getattr(route.endpoint, '__doc__', '') or f"{method.upper()} {route.path}",
-                            'handler': route.endpoint.__name__ if hasattr(route.endpoint, '__name__') else 'unknown'
-                        }
-                        result.append(endpoint_info)
-
+            for method, endpoint_id in _route_endpoint_ids(route):
+                endpoint_info = {
+                    'operationId': endpoint_id,
+                    'method': method,
+                    'path': route.path,
+                    'summary': getattr(route.endpoint, '__doc__', '') or f"{method} {route.path}",
+                    'handler': route.endpoint.__name__ if hasattr(route.endpoint, '__name__') else 'unknown'
+                }
+                result.append(endpoint_info)
+
+    _endpoints_cache = result
+    _endpoints_cache_key = cache_key
     return result
 
 
 def get_openapi_schema() -> Dict[str, Any]:
-    """Generate OpenAPI schema."""
+    """Generate OpenAPI schema.
+
+    The schema is cached until the registry, the app metadata or the route
+    objects change, so callers must treat it as read-only.
+    """
+    global _openapi_cache, _openapi_cache_key
+
     if _app is None:
         raise RuntimeError("FastAPI app not initialized yet")
 
     if hasattr(_app, 'routes'):
-        return get_openapi(
-            title=getattr(_app, 'title', 'FastAPI'),
-            version=getattr(_app, 'version', '0.1.0'),
-            description=getattr(_app, 'description', ''),
-            routes=_app.routes
+        title = getattr(_app, 'title', 'FastAPI')
+        version = getattr(_app, 'version', '0.1.0')
+        description = getattr(_app, 'description', '')
+        tags = getattr(_app, 'openapi_tags', None)
+        # Tags are a mutable list of dicts, so the key holds their repr
+        cache_key = (_registry_version, id(_app), _RoutesSnapshot(_app.routes),
+                     title, version, description, repr(tags))
+        if _openapi_cache is not None and _openapi_cache_key == cache_key:
+            return _openapi_cache
+
+        _openapi_cache = get_openapi(
+            title=title,
+            version=version,
+            description=description,
+            routes=_app.routes,
+            tags=tags
         )
+        _openapi_cache_key = cache_key
+        return _openapi_cache
     return {}
 
 # ---------------------------------------------------------------------------
@@ -576,69 +954,92 @@ def get_openapi_schema() -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+def _body_to_py(body: Any, body_json: Optional[str] = None) -> Any:
+    """Return the request body as Python objects.
+
+    ``body_json`` is JSON text sent by the frontend and takes precedence;
+    text that isn't valid JSON is passed through unchanged. ``body`` is used
+    as given, apart from converting a Pyodide JsProxy.
+    """
+    if body_json is not None:
+        _load_optional_deps()
+        try:
+            return orjson.loads(body_json) if HAS_ORJSON else json.loads(body_json)
+        except ValueError:
+            return body_json
+    if JsProxy is not None:
+        if isinstance(body, JsProxy):
+            body = body.to_py() if hasattr(body, "to_py") else to_py(body)
+    elif hasattr(body, "to_py"):
+        try:
+            body = body.to_py()
+        except Exception:
+            pass
+    return body
+
+
+def _find_handler(operation_id: str) -> Tuple[Optional[Callable[..., Any]], bool]:
+    """Find handler - first check registry, then check FastAPI routes.
+
+    Returns the handler and whether it is a coroutine function.
+    """
+    endpoint = _endpoints_registry.get(operation_id)
+    if endpoint is not None:
+        return endpoint.handler, endpoint.is_async
+    # Look for the endpoint in FastAPI routes
+    handler = _get_route_index().get(operation_id)
+    return handler, inspect.iscoroutinefunction(handler)
+
+
+def _handler_not_found(operation_id: str) -> Dict[str, Any]:
+    available_endpoints = list(_endpoints_registry.keys())
+    # Also add endpoints from FastAPI routes if registry is empty
+    if not available_endpoints:
+        available_endpoints = list(_get_route_index())
+
+    error_response = {"detail": f"Handler for {operation_id} not found"}
+    if DEBUG_LEVEL >= 1:
+        error_response["available_endpoints"] = available_endpoints
+    return {"content": error_response, "status_code": 404}
+
+
+def _exception_response(e: Exception) -> Dict[str, Any]:
+    """Build the response for an exception raised while running a handler."""
+    if isinstance(e, HTTPException):
+        return {
+            "content": format_error(e, DEBUG_LEVEL >= 1),
+            "status_code": e.status_code
+        }
+    log(f"Endpoint execution error: {e}")
+    if DEBUG_LEVEL >= 1:
+        traceback.print_exc()
+    return {
+        "content": format_error(e, DEBUG_LEVEL >= 1),
+        "status_code": 500
+    }
+
+
 async def execute_endpoint(
     operation_id: str,
     path_params: Optional[Dict[str, Any]] = None,
     query_params: Optional[Dict[str, Any]] = None,
-    body: Any = None
+    body: Any = None,
+    body_json: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Execute endpoint with full async support and event-loop fallback."""
+    """Execute endpoint with full async support and event-loop fallback.
+
+    ``body`` is passed to the handler as given; the frontend sends the body
+    as JSON text in ``body_json`` instead, which is parsed first.
+    """
     path_params = path_params or {}
     query_params = query_params or {}
 
-    # Handle Pyodide JsProxy conversion
-    try:
-        from pyodide.ffi import JsProxy, to_py
-        if isinstance(body, JsProxy):
-            body = body.to_py() if hasattr(body, "to_py") else to_py(body)
-    except (ModuleNotFoundError, ImportError):
-        if hasattr(body, "to_py"):
-            try:
-                body = body.to_py()
-            except Exception:
-                pass    # Find handler - first check registry, then check FastAPI routes
-    handler = None
-
-    if operation_id in _endpoints_registry:
-        handler = _endpoints_registry[operation_id]["handler"]
-    elif _app is not None and hasattr(_app, 'routes'):
-        # Look for the endpoint in FastAPI routes
-        for route in _app.routes:
-            if hasattr(route, 'methods') and hasattr(route, 'path'):
-                for method in route.methods:
-                    if method.upper() not in ('HEAD', 'OPTIONS'):
-                        # Generate operation ID the same way as in get_endpoints
-                        path_normalized = route.path.replace(
-                            '/', '_').replace('{', '').replace('}', '')
-                        if path_normalized.startswith('_'):
-                            path_normalized = path_normalized[1:]
-                        endpoint_id = f"{method.upper()}__{path_normalized}"
-
-                        if endpoint_id == operation_id:
-                            handler = route.endpoint
-                            break
-                if handler:
-                    break
+    # Parse JSON text from the frontend, or convert a Pyodide JsProxy
+    body = _body_to_py(body, body_json)
 
+    handler, is_async = _find_handler(operation_id)
     if not handler:
-        available_endpoints = list(_endpoints_registry.keys())
-        # Also add endpoints from FastAPI routes if registry is empty
-        if not available_endpoints and _app is not None and hasattr(_app, 'routes'):
-            for route in _app.routes:
-                if hasattr(route, 'methods') and hasattr(route, 'path'):
-                    for method in route.methods:
-                        if method.upper() not in ('HEAD', 'OPTIONS'):
-                            path_normalized = route.path.replace(
-                                '/', '_').replace('{', '').replace('}', '')
-                            if path_normalized.startswith('_'):
-                                path_normalized = path_normalized[1:]
-                            endpoint_id = f"{method.upper()}__{path_normalized}"
-                            available_endpoints.append(endpoint_id)
-
-        error_response = {"detail": f"Handler for {operation_id} not found"}
-        if DEBUG_LEVEL >= 1:
-            error_response["available_endpoints"] = available_endpoints
-        return {"content": error_response, "status_code": 404}
+        return _handler_not_found(operation_id)
 
     if not callable(handler):
         return {
@@ -648,11 +1049,11 @@ async def execute_endpoint(
 
     try:
         # Prepare arguments
-        sig = inspect.signature(handler)
-        kwargs = await _prepare_handler_kwargs(sig, path_params, query_params, body)
+        kwargs = await _prepare_handler_kwargs(
+            _get_param_plan(handler), path_params, query_params, body)
 
         # Execute handler with event-loop fallback
-        if inspect.iscoroutinefunction(handler):
+        if is_async:
             try:
                 # Try to use existing event loop - direct await to avoid double-await
                 asyncio.get_running_loop()
@@ -668,20 +1069,68 @@ async def execute_endpoint(
             "status_code": 200
         }
 
-    except HTTPException as e:
-        return {
-            "content": format_error(e, DEBUG_LEVEL >= 1),
-            "status_code": e.status_code
-        }
     except Exception as e:
-        log(f"Endpoint execution error: {e}")
-        if DEBUG_LEVEL >= 1:
-            traceback.print_exc()
+        return _exception_response(e)
+
+
+def is_sync_endpoint(operation_id: str) -> bool:
+    """Whether ``execute_endpoint_sync`` can run this endpoint.
+
+    True for plain-function handlers whose dependencies are all plain
+    functions or generators, so nothing along the call needs awaiting.
+    """
+    handler, is_async = _find_handler(operation_id)
+    if handler is None or is_async or not callable(handler):
+        return False
+    is_sync = _sync_handlers.get(handler)
+    if is_sync is None:
+        is_sync = not any(
+            _dependency_kind(default.dependency)[0]
+            for _name, _annotation, default, kind in _get_param_plan(handler)
+            if kind == _PARAM_DEPENDS
+        )
+        _sync_handlers[handler] = is_sync
+    return is_sync
+
+
+def execute_endpoint_sync(
+    operation_id: str,
+    path_params: Optional[Dict[str, Any]] = None,
+    query_params: Optional[Dict[str, Any]] = None,
+    body: Any = None,
+    body_json: Optional[str] = None
+) -> Dict[str, Any]:
+    """Execute a sync endpoint without going through the event loop.
+
+    Only valid when ``is_sync_endpoint(operation_id)`` is true; anything else
+    must use ``execute_endpoint``.
+    """
+    path_params = path_params or {}
+    query_params = query_params or {}
+
+    body = _body_to_py(body, body_json)
+
+    handler, _is_async = _find_handler(operation_id)
+    if not handler:
+        return _handler_not_found(operation_id)
+
+    if not is_sync_endpoint(operation_id):
         return {
-            "content": format_error(e, DEBUG_LEVEL >= 1),
+            "content": {"detail": f"Handler for {operation_id} must be awaited, use execute_endpoint"},
             "status_code": 500
         }
 
+    try:
+        kwargs = _prepare_handler_kwargs_sync(
+            _get_param_plan(handler), path_params, query_params, body)
+        return {
+            "content": convert_to_serializable(handler(**kwargs)),
+            "status_code": 200
+        }
+
+    except Exception as e:
+        return _exception_response(e)
+
 
 # ---------------------------------------------------------------------------
 # Environment detection
@@ -721,114 +1170,116 @@ async def _run_with_fallback(coro):
         return asyncio.run(coro)
 
 
+def _convert_param(val: Any, annotation: Any) -> Any:
+    """Convert parameter value to expected type."""
+    try:
+        if annotation in (int, float, bool, str):
+            return annotation(val)
+        return val
+    except Exception:
+        return val
+
+
 async def _prepare_handler_kwargs(
-    sig: inspect.Signature,
+    plan: tuple,
     path_params: Dict[str, Any],
     query_params: Dict[str, Any],
     body: Any
 ) -> Dict[str, Any]:
-    """Prepare handler keyword arguments with type conversion."""
-    kwargs: Dict[str, Any] = {}
+    """Prepare handler keyword arguments with type conversion.
 
-    def _convert_param(val: Any, annotation: Any) -> Any:
-        """Convert parameter value to expected type."""
-        try:
-            if annotation in (int, float, bool, str):
-                return annotation(val)
-            return val
-        except Exception:
-            return val
+    Like FastAPI, a dependency shared by several parameters is called once
+    per request unless declared with ``use_cache=False``.
+    """
+    kwargs: Dict[str, Any] = {}
+    # Keyed by id() so unhashable callables work; the plan keeps them alive
+    dep_cache: Dict[int, Any] = {}
 
-    for name, param in sig.parameters.items():
+    for name, annotation, default, kind in plan:
         if name in path_params:
-            kwargs[name] = _convert_param(path_params[name], param.annotation)
+            kwargs[name] = _convert_param(path_params[name], annotation)
         elif name in query_params:
-            kwargs[name] = _convert_param(query_params[name], param.annotation)
-        elif isinstance(param.default, _DependsShim):
-            kwargs[name] = await param.default.resolve()
-        elif hasattr(param.default, "dependency"):
-            # Handle FastAPI Depends
-            dep = param.default.dependency
-            if inspect.iscoroutinefunction(dep):
-                kwargs[name] = await dep()
+            kwargs[name] = _convert_param(query_params[name], annotation)
+        elif kind == _PARAM_DEPENDS:
+            dep = default.dependency
+            if getattr(default, "use_cache", True) and id(dep) in dep_cache:
+                kwargs[name] = dep_cache[id(dep)]
+            elif isinstance(default, _DependsShim):
+                kwargs[name] = dep_cache[id(dep)] = await default.resolve()
             else:
-                result = dep()
-                import types
-                if isinstance(result, types.GeneratorType) or hasattr(result, "__next__"):
-                    try:
-                        kwargs[name] = next(result)
-                    except StopIteration as exc:
-                        kwargs[name] = exc.value
+                # Handle FastAPI Depends
+                is_async, is_generator = _dependency_kind(dep)
+                if is_async:
+                    kwargs[name] = dep_cache[id(dep)] = await dep()
                 else:
-                    kwargs[name] = result
-        elif param.default is not inspect.Parameter.empty:
+                    kwargs[name] = dep_cache[id(dep)] = _call_sync_dependency(dep, is_generator)
+        elif kind == _PARAM_FIELD:
             # Handle FastAPI Query, Path, etc.
-            default_val = param.default
-
-            # Check if it's a FastAPI parameter (Query, Path, etc) - check for 'default' attribute safely
+            kwargs[name] = default.default
+        elif kind == _PARAM_VALUE:
+            kwargs[name] = default
+        elif body is not None and annotation != inspect._empty:
+            # Try to instantiate Pydantic model
             try:
-                if hasattr(default_val, 'default') and not callable(default_val):
-                    kwargs[name] = default_val.default
-                # Check if it's a Depends object we missed
-                elif isinstance(default_val, _DependsShim):
-                    kwargs[name] = await default_val.resolve()
-                elif hasattr(default_val, "dependency"):
-                    # Handle FastAPI Depends that we might have missed
-                    dep = default_val.dependency
-                    if inspect.iscoroutinefunction(dep):
-                        kwargs[name] = await dep()
-                    else:
-                        result = dep()
-                        import types
-                        if isinstance(result, types.GeneratorType) or hasattr(result, "__next__"):
-                            try:
-                                kwargs[name] = next(result)
-                            except StopIteration as exc:
-                                kwargs[name] = exc.value
-                        else:
-                            kwargs[name] = result
-                else:
-                    kwargs[name] = default_val
-            except Exception as e:
-                log(f"Error processing param {name}: {e}")
-                kwargs[name] = None
-        elif body is not None and param.annotation != inspect._empty:
+                kwargs[name] = annotation(**body)
+            except Exception:
+                kwargs[name] = body
+
+    return kwargs
+
+def _prepare_handler_kwargs_sync(
+    plan: tuple,
+    path_params: Dict[str, Any],
+    query_params: Dict[str, Any],
+    body: Any
+) -> Dict[str, Any]:
+    """Synchronous ``_prepare_handler_kwargs`` for handlers without async deps."""
+    kwargs: Dict[str, Any] = {}
+    # Keyed by id() so unhashable callables work; the plan keeps them alive
+    dep_cache: Dict[int, Any] = {}
+
+    for name, annotation, default, kind in plan:
+        if name in path_params:
+            kwargs[name] = _convert_param(path_params[name], annotation)
+        elif name in query_params:
+            kwargs[name] = _convert_param(query_params[name], annotation)
+        elif kind == _PARAM_DEPENDS:
+            dep = default.dependency
+            if getattr(default, "use_cache", True) and id(dep) in dep_cache:
+                kwargs[name] = dep_cache[id(dep)]
+                continue
+            kwargs[name] = dep_cache[id(dep)] = _call_sync_dependency(
+                dep, _dependency_kind(dep)[1])
+        elif kind == _PARAM_FIELD:
+            # Handle FastAPI Query, Path, etc.
+            kwargs[name] = default.default
+        elif kind == _PARAM_VALUE:
+            kwargs[name] = default
+        elif body is not None and annotation != inspect._empty:
             # Try to instantiate Pydantic model
             try:
-                kwargs[name] = param.annotation(**body)
+                kwargs[name] = annotation(**body)
             except Exception:
                 kwargs[name] = body
 
     return kwargs
 
 # ---------------------------------------------------------------------------
-# Enhanced Uvicorn stub with UserWarning and help URL
+# Enhanced Uvicorn stub with debug-gated notice and help URL
 # ---------------------------------------------------------------------------
 
 
 class _UvicornStub(ModuleType):
     def run(self, app: Any, host: str = "127.0.0.1", port: int = 8000, **kwargs):
-        """Uvicorn stub that warns about Pyodide limitations."""
-        warnings.warn(
-            "Running inside Pyodide: 'uvicorn.run' is a no-op. "
-            "See: https://fastapi.tiangolo.com/deployment/concepts/",
-            UserWarning,
-            stacklevel=2
-        )
+        """Uvicorn stub that notes Pyodide limitations when debugging."""
+        log("Running inside Pyodide: 'uvicorn.run' is a no-op. "
+            "See: https://fastapi.tiangolo.com/deployment/concepts/")
         log(f"Uvicorn stub: would run {getattr(app, 'title', 'FastAPI')} on {host}:{port}")
 
 
 # Install uvicorn stub
 sys.modules["uvicorn"] = _UvicornStub("uvicorn")
 
-# ---------------------------------------------------------------------------
-# Endpoint registry and execution
-# ---------------------------------------------------------------------------
-
-# Global endpoint registry
-_endpoints_registry = {}
-
-
 # ---------------------------------------------------------------------------
 # Lazy app proxy to handle early imports
 # ---------------------------------------------------------------------------
@@ -875,6 +1326,8 @@ __all__ = [
     "Depends",
     "convert_to_serializable",
     "execute_endpoint",
+    "execute_endpoint_sync",
+    "is_sync_endpoint",
     "get_endpoints",
     "get_openapi_schema",
     "app",
@@ -5,8 +5,11 @@ from fastapi import Depends
 from app.db.session import get_db as get_db_session, HAS_ASYNC_SQLALCHEMY, IS_PYODIDE
 from app.core.security import get_current_user as get_current_user_impl, get_current_user_sync
 
+# Async sessions in CPython when the async stack is installed, sync otherwise
+USE_ASYNC_DB = HAS_ASYNC_SQLALCHEMY and not IS_PYODIDE
+
 # Database dependency
-if HAS_ASYNC_SQLALCHEMY and not IS_PYODIDE:
+if USE_ASYNC_DB:
     # Use async database session for CPython
     async def get_db() -> AsyncGenerator:
         async for session in get_db_session():
@@ -18,7 +21,7 @@ else:
 
 
 # User dependency functions
-if HAS_ASYNC_SQLALCHEMY and not IS_PYODIDE:
+if USE_ASYNC_DB:
     get_current_user = get_current_user_impl
 else:
     get_current_user = get_current_user_sync
@@ -0,0 +1,52 @@
+"""ASGI middleware for the CPython server."""
+from typing import Dict, Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _copy_message(message: Message) -> Message:
+    """Copy an ASGI message so outer middleware can't edit the cached one."""
+    copied = dict(message)
+    if "headers" in copied:
+        copied["headers"] = list(copied["headers"])
+    return copied
+
+
+class StaticResponseCacheMiddleware:
+    """Replay responses for GET requests to paths whose output never changes.
+
+    The first 200 response for each (path, root_path) pair is captured and
+    every later request is answered from it without entering the router.
+    Install it inside CORSMiddleware so CORS headers stay per-request.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]) -> None:
+        self.app = app
+        self.paths = frozenset(path for path in paths if path)
+        self._cache: Dict[Tuple[str, str], List[Message]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["path"], scope.get("root_path", ""))
+        cached = self._cache.get(key)
+        if cached is not None:
+            for message in cached:
+                await send(_copy_message(message))
+            return
+
+        captured: List[Message] = []
+
+        async def capture(message: Message) -> None:
+            captured.append(_copy_message(message))
+            await send(message)
+
+        await self.app(scope, receive, capture)
+        if captured and captured[0].get("status") == 200:
+            self._cache[key] = captured
@@ -4,11 +4,8 @@ from typing import Dict, Any
 from .runtime import get_environment_info
 
 
-async def get_current_user() -> Dict[str, Any]:
-    """
-    Get current user for dependency injection.
-    In a real app, this would validate JWT tokens, etc.
-    """
+def _build_demo_user() -> Dict[str, Any]:
+    """Build the demo user returned by the user dependencies."""
     env_info = get_environment_info()
 
     return {
@@ -20,14 +17,19 @@ async def get_current_user() -> Dict[str, Any]:
     }
 
 
+# The demo user only depends on the environment, which is fixed per process,
+# so one instance is shared by every request; treat it as read-only
+_DEMO_USER = _build_demo_user()
+
+
+async def get_current_user() -> Dict[str, Any]:
+    """
+    Get current user for dependency injection.
+    In a real app, this would validate JWT tokens, etc.
+    """
+    return _DEMO_USER
+
+
 def get_current_user_sync() -> Dict[str, Any]:
     """Synchronous version of get_current_user for legacy compatibility."""
-    env_info = get_environment_info()
-
-    return {
-        "id": 1,
-        "name": "Demo User",
-        "role": "admin",
-        "environment": env_info["description"],
-        "database_type": env_info["type"]
-    }
+    return _DEMO_USER
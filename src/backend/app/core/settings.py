@@ -1,7 +1,8 @@
 """Application settings and configuration."""
 import os
+from functools import lru_cache
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .runtime import get_environment, IS_PYODIDE
 
@@ -9,6 +10,9 @@ from .runtime import get_environment, IS_PYODIDE
 class Settings(BaseModel):
     """Application settings with environment-specific defaults."""
 
+    # Shared process-wide by get_settings(), so never mutated in place
+    model_config = ConfigDict(frozen=True)
+
     # Application
     app_name: str = Field(default="Enhanced Bridge SQLAlchemy Demo")
     app_version: str = Field(default="2.0.0")
@@ -35,8 +39,9 @@ class Settings(BaseModel):
     redoc_url: str = Field(default="/redoc")
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings, built once on first use."""
     return Settings()
 
 
@@ -2,7 +2,7 @@
 from typing import Dict, Any
 
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import insert, text
 
 from app.db.base import Base
 from app.db.session import engine, get_db_sync, DATABASE_URL, ENVIRONMENT, HAS_ASYNC_SQLALCHEMY
@@ -83,40 +83,31 @@ def init_sample_data(db: Session) -> Dict[str, Any]:
                 "age": 32, "bio": "DevOps engineer optimizing workflows"},
         ]
 
-        created_users = []
-        for user_data in users_data:
-            user = User(**user_data)
-            db.add(user)
-            created_users.append(user)
-
-        db.commit()
-
-        # Refresh to get IDs
-        for user in created_users:
-            db.refresh(user)
+        # One multi-row INSERT ... RETURNING instead of add/commit/refresh per
+        # user; rows come back unordered, so map IDs by the unique email
+        user_ids = dict(db.execute(
+            insert(User).returning(User.email, User.id), users_data).all())
+        author_ids = [user_ids[user_data["email"]] for user_data in users_data]
 
         # Create sample posts
         posts_data = [
             {"title": "Welcome to Persistent FastAPI", "content": "This FastAPI demo now uses persistent storage! Data survives page reloads.",
-                "author_id": created_users[0].id, "published": True},
+                "author_id": author_ids[0], "published": True},
             {"title": "SQLAlchemy + Pyodide Magic", "content": "Running SQLAlchemy with persistent databases entirely in the browser is amazing!",
-                "author_id": created_users[1].id, "published": True},
+                "author_id": author_ids[1], "published": True},
             {"title": "Building Web Apps with No Backend", "content": "With persistent Pyodide, you can build full-stack apps that run entirely client-side.",
-                "author_id": created_users[2].id, "published": False},
+                "author_id": author_ids[2], "published": False},
             {"title": "Data Science Meets Web Development", "content": "Pyodide bridges Python data science and web development beautifully.",
-                "author_id": created_users[1].id, "published": True},
+                "author_id": author_ids[1], "published": True},
             {"title": "The Future of Client-Side Apps", "content": "Persistent storage in the browser opens up incredible possibilities.",
-                "author_id": created_users[3].id, "published": True},
+                "author_id": author_ids[3], "published": True},
             {"title": "DevOps in the Browser", "content": "Managing persistent data without servers is a game-changer for deployment.",
-                "author_id": created_users[4].id, "published": True},
+                "author_id": author_ids[4], "published": True},
             {"title": "Draft: More Ideas Coming", "content": "This is a draft post to show unpublished content.",
-                "author_id": created_users[0].id, "published": False},
+                "author_id": author_ids[0], "published": False},
         ]
 
-        for post_data in posts_data:
-            post = Post(**post_data)
-            db.add(post)
-
+        db.execute(insert(Post), posts_data)
         db.commit()
         logger.info(
             f"Created {len(users_data)} users and {len(posts_data)} posts")
@@ -2,24 +2,26 @@
 import os
 from typing import AsyncGenerator
 
-try:
-    from sqlalchemy.ext.asyncio import (
-        AsyncSession,
-        async_sessionmaker,
-        create_async_engine
-    )
-    # Test if aiosqlite is available
-    import aiosqlite
-    HAS_ASYNC_SQLALCHEMY = True
-except ImportError:
-    # Fallback for environments without async SQLAlchemy or aiosqlite
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker, Session as SyncSession
-    HAS_ASYNC_SQLALCHEMY = False
-
 from app.core.runtime import IS_PYODIDE, get_environment
 from app.core.logging import get_logger
 
+# Pyodide always uses sync SQLAlchemy, so the async stack is only imported
+# (and HAS_ASYNC_SQLALCHEMY only set) on CPython
+HAS_ASYNC_SQLALCHEMY = False
+if not IS_PYODIDE:
+    try:
+        from sqlalchemy.ext.asyncio import (
+            AsyncSession,
+            async_sessionmaker,
+            create_async_engine
+        )
+        # Test if aiosqlite is available
+        import aiosqlite  # noqa: F401
+        HAS_ASYNC_SQLALCHEMY = True
+    except ImportError:
+        # Fallback for environments without async SQLAlchemy or aiosqlite
+        pass
+
 logger = get_logger(__name__)
 
 
@@ -59,6 +61,9 @@ DATABASE_URL, ENVIRONMENT = get_database_url()
 
 if HAS_ASYNC_SQLALCHEMY and not IS_PYODIDE:
     # Use async SQLAlchemy for CPython
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
     # Convert sync SQLite URL to async for local development
     async_url = DATABASE_URL.replace("sqlite:///", "sqlite+aiosqlite:///")
     engine = create_async_engine(async_url, echo=False)
@@ -73,6 +78,16 @@ if HAS_ASYNC_SQLALCHEMY and not IS_PYODIDE:
                 yield session
             finally:
                 await session.close()
+
+    # Sync engine for get_db_sync (startup data seeding), built once so each
+    # call doesn't set up a new dialect and connection pool
+    _sync_engine = create_engine(
+        DATABASE_URL.replace("sqlite+aiosqlite:///", "sqlite:///"),
+        connect_args={
+            "check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    )
+    SessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=_sync_engine)
 else:
     # Use sync SQLAlchemy for Pyodide or environments without async support
     from sqlalchemy import create_engine
@@ -96,18 +111,4 @@ else:
 
 def get_db_sync():
     """Get synchronous database session for compatibility."""
-    if not IS_PYODIDE and HAS_ASYNC_SQLALCHEMY:
-        # In CPython with async support, we need a sync session for certain operations
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        sync_engine = create_engine(
-            DATABASE_URL.replace("sqlite+aiosqlite:///", "sqlite:///"),
-            connect_args={
-                "check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-        )
-        SyncSessionLocal = sessionmaker(
-            autocommit=False, autoflush=False, bind=sync_engine)
-        return SyncSessionLocal()
-    else:
-        # Use existing sync session maker
-        return SessionLocal()
+    return SessionLocal()
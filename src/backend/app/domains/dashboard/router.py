@@ -4,59 +4,81 @@ from typing import Union
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, case, select, func, true
 
-from app.core.deps import get_db, get_current_user
+from app.core.deps import USE_ASYNC_DB, get_db, get_current_user
 from app.db.session import DATABASE_URL, ENVIRONMENT
 from app.domains.models import User, Post
 
 router = APIRouter()
 
+# ENVIRONMENT and DATABASE_URL are fixed per process, so resolve once
+_PERSISTENCE_ENABLED = "persist" in DATABASE_URL
+_PERSISTENCE_NOTE = {
+    "pyodide-persistent": "All this data survives page reloads via IndexedDB!",
+    "fastapi-production": "Data persists in production database",
+    "fastapi-development": "Data resets on server restart (development mode)"
+}.get(ENVIRONMENT, "Data persistence varies by environment")
+_GENERATED_IN = {
+    "pyodide-persistent": "Pyodide Browser (Persistent)",
+    "fastapi-production": "FastAPI Backend (Production)",
+    "fastapi-development": "FastAPI Backend (Development)"
+}.get(ENVIRONMENT, "Unknown Environment")
+# Shared by every dashboard response; treat as read-only
+_PERSISTENCE_INFO = {
+    "enabled": _PERSISTENCE_ENABLED,
+    "database_url": DATABASE_URL,
+    "environment": ENVIRONMENT,
+    "note": _PERSISTENCE_NOTE
+}
 
-@router.get("/dashboard",
-            summary="Dashboard with mixed SQLAlchemy models",
-            description="Complex response combining multiple SQLAlchemy models",
-            tags=["dashboard"],
-            operation_id="get_dashboard")
-async def get_dashboard(
-    db: Union[Session, AsyncSession] = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
-):
-    """Dashboard with complex mixed SQLAlchemy model response."""
-    # Get statistics
-    if isinstance(db, AsyncSession):
-        # Async queries
-        total_users_result = await db.execute(select(func.count(User.id)))
-        total_users = total_users_result.scalar()
+# Statements are built once and reused by every request; SQLAlchemy caches
+# their compiled SQL, so per-request work is just parameter binding
+_USER_COUNT = select(func.count(User.id))
+_USERS_SINCE = select(func.count(User.id)).where(User.created_at >= bindparam("cutoff"))
+_POSTS_SINCE = select(func.count(Post.id)).where(Post.created_at >= bindparam("cutoff"))
+# Rows inserted together share created_at, so the id breaks ties
+_RECENT_USERS = select(User).order_by(User.created_at.desc(), User.id.desc()).limit(3)
+_RECENT_POSTS = select(Post).order_by(Post.created_at.desc(), Post.id.desc()).limit(3)
 
-        active_users_result = await db.execute(select(func.count(User.id)).where(User.is_active == True))
-        active_users = active_users_result.scalar()
+# Per-table totals from a single scan each: a count plus a conditional sum
+_USER_TOTALS = select(
+    func.count(User.id).label("total_users"),
+    func.coalesce(func.sum(case((User.is_active == True, 1), else_=0)), 0).label("active_users"),
+)
+_POST_TOTALS = select(
+    func.count(Post.id).label("total_posts"),
+    func.coalesce(func.sum(case((Post.published == True, 1), else_=0)), 0).label("published_posts"),
+)
+_post_totals = _POST_TOTALS.subquery()
 
-        total_posts_result = await db.execute(select(func.count(Post.id)))
-        total_posts = total_posts_result.scalar()
+# Dashboard counts in one round trip by joining the two one-row totals
+_user_totals = _USER_TOTALS.subquery()
+_DASHBOARD_COUNTS = select(_user_totals, _post_totals).select_from(
+    _user_totals.join(_post_totals, true()))
 
-        published_posts_result = await db.execute(select(func.count(Post.id)).where(Post.published == True))
-        published_posts = published_posts_result.scalar()
+# Analytics totals in one round trip: user aggregates plus the post totals
+_user_analytics = select(
+    func.count(User.id),
+    func.sum(case((User.is_active == True, 1), else_=0)),
+    func.avg(User.age),
+).subquery()
+_ANALYTICS_TOTALS = select(_user_analytics, _post_totals).select_from(
+    _user_analytics.join(_post_totals, true()))
 
-        # Get recent users and posts
-        recent_users_result = await db.execute(select(User).order_by(User.created_at.desc()).limit(3))
-        recent_users = list(recent_users_result.scalars().all())
+# Most productive authors
+_TOP_AUTHORS = (
+    select(User.name, func.count(Post.id).label('post_count'))
+    .join(Post)
+    .group_by(User.id, User.name)
+    .order_by(func.count(Post.id).desc())
+    .limit(5)
+)
 
-        recent_posts_result = await db.execute(select(Post).order_by(Post.created_at.desc()).limit(3))
-        recent_posts = list(recent_posts_result.scalars().all())
-    else:
-        # Sync queries
-        total_users = db.query(User).count()
-        active_users = db.query(User).filter(User.is_active == True).count()
-        total_posts = db.query(Post).count()
-        published_posts = db.query(Post).filter(Post.published == True).count()
-
-        # Get recent users and posts
-        recent_users = db.query(User).order_by(
-            User.created_at.desc()).limit(3).all()
-        recent_posts = db.query(Post).order_by(
-            Post.created_at.desc()).limit(3).all()
 
+def _dashboard_response(current_user: dict, counts, recent_users, recent_posts) -> dict:
+    """Assemble the dashboard payload shared by the async and sync handlers."""
+    total_users, active_users, total_posts, published_posts = counts
     return {
         "message": f"Welcome {current_user['name']} to the Dashboard!",
         "user_info": current_user,
@@ -69,96 +91,70 @@ async def get_dashboard(
             "published_posts": published_posts,
             "engagement_rate": round((published_posts / total_posts * 100) if total_posts > 0 else 0, 1)
         },
-        "persistence_info": {
-            "enabled": "persist" in DATABASE_URL,
-            "database_url": DATABASE_URL,
-            "environment": ENVIRONMENT,
-            "note": {
-                "pyodide-persistent": "All this data survives page reloads via IndexedDB!",
-                "fastapi-production": "Data persists in production database",
-                "fastapi-development": "Data resets on server restart (development mode)"
-            }.get(ENVIRONMENT, "Data persistence varies by environment")
-        },
+        "persistence_info": _PERSISTENCE_INFO,
         "timestamp": datetime.utcnow(),
-        "generated_in": {
-            "pyodide-persistent": "Pyodide Browser (Persistent)",
-            "fastapi-production": "FastAPI Backend (Production)",
-            "fastapi-development": "FastAPI Backend (Development)"
-        }.get(ENVIRONMENT, "Unknown Environment")
+        "generated_in": _GENERATED_IN
     }
 
 
-@router.get("/analytics",
-            summary="Analytics with aggregated data",
-            description="Complex analytics combining SQLAlchemy queries and models",
-            tags=["dashboard"],
-            operation_id="get_analytics")
-async def get_analytics(
-    db: Union[Session, AsyncSession] = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
-):
-    """Analytics endpoint with aggregated data."""
-    if isinstance(db, AsyncSession):
-        # Async queries
-        user_stats_result = await db.execute(
-            select(
-                func.count(User.id).label('total'),
-                func.sum(func.case([(User.is_active == True, 1)], else_=0)).label(
-                    'active'),
-                func.avg(User.age).label('avg_age')
-            )
-        )
-        user_stats = user_stats_result.first()
-
-        post_stats_result = await db.execute(
-            select(
-                func.count(Post.id).label('total'),
-                func.sum(func.case([(Post.published == True, 1)], else_=0)).label(
-                    'published')
-            )
-        )
-        post_stats = post_stats_result.first()
-
-        # Get most productive authors
-        top_authors_result = await db.execute(
-            select(User.name, func.count(Post.id).label('post_count'))
-            .join(Post)
-            .group_by(User.id, User.name)
-            .order_by(func.count(Post.id).desc())
-            .limit(5)
-        )
-        top_authors = list(top_authors_result.all())
-    else:
-        # Sync queries
-        user_stats = db.query(
-            func.count(User.id).label('total'),
-            func.sum(func.case([(User.is_active == True, 1)], else_=0)).label(
-                'active'),
-            func.avg(User.age).label('avg_age')
-        ).first()
-
-        post_stats = db.query(
-            func.count(Post.id).label('total'),
-            func.sum(func.case([(Post.published == True, 1)], else_=0)).label(
-                'published')
-        ).first()
-
-        # Get most productive authors
-        top_authors = db.query(
-            User.name,
-            func.count(Post.id).label('post_count')
-        ).join(Post).group_by(User.id, User.name).order_by(func.count(Post.id).desc()).limit(5).all()
+# The session type is fixed per process, so only the matching handler is
+# defined and registered
+if USE_ASYNC_DB:
+    async def get_dashboard(
+        db: AsyncSession = Depends(get_db),
+        current_user: dict = Depends(get_current_user)
+    ):
+        """Dashboard with complex mixed SQLAlchemy model response."""
+        # Get statistics
+        counts_result = await db.execute(_DASHBOARD_COUNTS)
+        counts = counts_result.one()
+
+        # Get recent users and posts
+        recent_users_result = await db.execute(_RECENT_USERS)
+        recent_users = list(recent_users_result.scalars().all())
+
+        recent_posts_result = await db.execute(_RECENT_POSTS)
+        recent_posts = list(recent_posts_result.scalars().all())
+
+        return _dashboard_response(current_user, counts, recent_users, recent_posts)
+else:
+    def get_dashboard(
+        db: Session = Depends(get_db),
+        current_user: dict = Depends(get_current_user)
+    ):
+        """Dashboard with complex mixed SQLAlchemy model response."""
+        # Get statistics
+        counts = db.execute(_DASHBOARD_COUNTS).one()
+
+        # Get recent users and posts
+        recent_users = db.execute(_RECENT_USERS).scalars().all()
+        recent_posts = db.execute(_RECENT_POSTS).scalars().all()
+
+        return _dashboard_response(current_user, counts, recent_users, recent_posts)
+
+router.get("/dashboard",
+           summary="Dashboard with mixed SQLAlchemy models",
+           description="Complex response combining multiple SQLAlchemy models",
+           tags=["dashboard"],
+           operation_id="get_dashboard")(get_dashboard)
+
+
+def _analytics_response(totals, top_authors) -> dict:
+    """Assemble the analytics payload shared by the async and sync handlers."""
+    total_users, active_users, avg_age, total_posts, published_posts = totals
+    total_posts = total_posts or 0
+    published_posts = published_posts or 0
 
     return {
         "user_analytics": {
-            "total_users": user_stats.total or 0,
-            "active_users": user_stats.active or 0,
-            "average_age": round(float(user_stats.avg_age or 0), 1)
+            "total_users": total_users or 0,
+            "active_users": active_users or 0,
+            "average_age": round(float(avg_age or 0), 1)
         },
         "post_analytics": {
-            "total_posts": post_stats.total or 0,
-            "published_posts": post_stats.published or 0,
-            "draft_posts": (post_stats.total or 0) - (post_stats.published or 0)
+            "total_posts": total_posts,
+            "published_posts": published_posts,
+            "draft_posts": total_posts - published_posts
         },
         "top_authors": [
             {"name": author.name, "post_count": author.post_count}
@@ -169,6 +165,37 @@ async def get_analytics(
     }
 
 
+if USE_ASYNC_DB:
+    async def get_analytics(
+        db: AsyncSession = Depends(get_db),
+        current_user: dict = Depends(get_current_user)
+    ):
+        """Analytics endpoint with aggregated data."""
+        totals_result = await db.execute(_ANALYTICS_TOTALS)
+        totals = totals_result.one()
+
+        top_authors_result = await db.execute(_TOP_AUTHORS)
+        top_authors = list(top_authors_result.all())
+
+        return _analytics_response(totals, top_authors)
+else:
+    def get_analytics(
+        db: Session = Depends(get_db),
+        current_user: dict = Depends(get_current_user)
+    ):
+        """Analytics endpoint with aggregated data."""
+        totals = db.execute(_ANALYTICS_TOTALS).one()
+        top_authors = db.execute(_TOP_AUTHORS).all()
+
+        return _analytics_response(totals, top_authors)
+
+router.get("/analytics",
+           summary="Analytics with aggregated data",
+           description="Complex analytics combining SQLAlchemy queries and models",
+           tags=["dashboard"],
+           operation_id="get_analytics")(get_analytics)
+
+
 @router.get("/dashboard/async-stats",
             summary="Async dashboard statistics",
             description="Demonstrates async database queries with real-time stats",
@@ -189,34 +216,28 @@ async def get_async_dashboard_stats(
         """Get total user count with simulated delay."""
         await asyncio.sleep(0.05)  # Simulate some processing time
         if isinstance(db, AsyncSession):
-            result = await db.execute(select(func.count(User.id)))
+            result = await db.execute(_USER_COUNT)
             return result.scalar() or 0
         else:
-            return db.query(User).count()
+            return db.execute(_USER_COUNT).scalar()
 
     async def get_recent_activity():
         """Get recent activity with simulated delay."""
         await asyncio.sleep(0.08)  # Simulate processing time
         cutoff_time = datetime.utcnow() - timedelta(days=7)
 
+        params = {"cutoff": cutoff_time}
+
         if isinstance(db, AsyncSession):
-            recent_users_result = await db.execute(
-                select(func.count(User.id)).where(
-                    User.created_at >= cutoff_time)
-            )
-            recent_posts_result = await db.execute(
-                select(func.count(Post.id)).where(
-                    Post.created_at >= cutoff_time)
-            )
+            recent_users_result = await db.execute(_USERS_SINCE, params)
+            recent_posts_result = await db.execute(_POSTS_SINCE, params)
             return {
                 "recent_users": recent_users_result.scalar() or 0,
                 "recent_posts": recent_posts_result.scalar() or 0
             }
         else:
-            recent_users = db.query(User).filter(
-                User.created_at >= cutoff_time).count()
-            recent_posts = db.query(Post).filter(
-                Post.created_at >= cutoff_time).count()
+            recent_users = db.execute(_USERS_SINCE, params).scalar()
+            recent_posts = db.execute(_POSTS_SINCE, params).scalar()
             return {
                 "recent_users": recent_users,
                 "recent_posts": recent_posts
@@ -227,21 +248,14 @@ async def get_async_dashboard_stats(
         await asyncio.sleep(0.06)  # Simulate processing time
 
         if isinstance(db, AsyncSession):
-            published_result = await db.execute(
-                select(func.count(Post.id)).where(Post.published == True)
-            )
-            total_result = await db.execute(select(func.count(Post.id)))
-            return {
-                "published_posts": published_result.scalar() or 0,
-                "total_posts": total_result.scalar() or 0
-            }
+            totals_result = await db.execute(_POST_TOTALS)
+            total, published = totals_result.one()
         else:
-            published = db.query(Post).filter(Post.published == True).count()
-            total = db.query(Post).count()
-            return {
-                "published_posts": published,
-                "total_posts": total
-            }
+            total, published = db.execute(_POST_TOTALS).one()
+        return {
+            "published_posts": published,
+            "total_posts": total
+        }
 
     # Execute all queries concurrently
     user_count_task = asyncio.create_task(get_user_count())
@@ -120,8 +120,8 @@ class UserService:
         """Get all posts by a specific user."""
         if isinstance(self.db, AsyncSession):
             stmt = select(Post).where(Post.author_id ==
-                                      user_id).order_by(Post.created_at.desc())
+                                      user_id).order_by(Post.created_at.desc(), Post.id.desc())
             result = await self.db.execute(stmt)
             return list(result.scalars().all())
         else:
-            return self.db.query(Post).filter(Post.author_id == user_id).order_by(Post.created_at.desc()).all()
+            return self.db.query(Post).filter(Post.author_id == user_id).order_by(Post.created_at.desc(), Post.id.desc()).all()
@@ -0,0 +1,313 @@
+"""Unit tests for the Pyodide bridge."""
+import asyncio
+import gc
+import sys
+import types
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from fastapi import Depends, HTTPException
+from pydantic import BaseModel
+
+from app.core import bridge
+
+
+@pytest.fixture
+def bridge_app(monkeypatch):
+    """Install a fresh FastAPI app as the bridge singleton."""
+    app = bridge.OriginalFastAPI(title="Bridge Test", version="1.0.0")
+    monkeypatch.setattr(bridge, "_app", app)
+    monkeypatch.setattr(bridge, "_endpoints_registry", {})
+    monkeypatch.setattr(bridge, "DEBUG_LEVEL", 0)
+    return app
+
+
+def load_routes(app, path):
+    """Replace all app routes with a single GET route, as a code reload does."""
+    app.router.routes.clear()
+
+    @app.get(path)
+    def read_path():
+        return {"path": path}
+
+
+def test_api_prefix_fallback_is_not_cached(monkeypatch):
+    """Test that the default prefix is retried until settings import."""
+    monkeypatch.setattr(bridge, "_api_prefix", None)
+    monkeypatch.setitem(sys.modules, "app.core.settings", None)
+
+    assert bridge._get_api_prefix() == "/api/v1"
+    assert bridge._api_prefix is None
+
+    settings_module = types.ModuleType("app.core.settings")
+    settings_module.settings = types.SimpleNamespace(api_v1_prefix="/api/v2")
+    monkeypatch.setitem(sys.modules, "app.core.settings", settings_module)
+
+    assert bridge._get_api_prefix() == "/api/v2"
+    assert bridge._api_prefix == "/api/v2"
+
+
+def test_get_endpoints_follows_route_reload(bridge_app):
+    """Test that the cached endpoint list is rebuilt when routes are swapped."""
+    load_routes(bridge_app, "/items")
+    assert [e["path"] for e in bridge.get_endpoints()] == ["/items"]
+
+    load_routes(bridge_app, "/products")
+    assert [e["path"] for e in bridge.get_endpoints()] == ["/products"]
+
+
+def test_openapi_schema_follows_route_reload(bridge_app):
+    """Test that the cached schema is rebuilt when routes are swapped."""
+    load_routes(bridge_app, "/items")
+    assert list(bridge.get_openapi_schema()["paths"]) == ["/items"]
+
+    load_routes(bridge_app, "/products")
+    assert list(bridge.get_openapi_schema()["paths"]) == ["/products"]
+
+    bridge_app.openapi_tags = [{"name": "products"}]
+    assert bridge.get_openapi_schema()["tags"] == [{"name": "products"}]
+
+
+def test_execute_endpoint_follows_route_reload(bridge_app):
+    """Test that endpoint ids resolve to the routes after a reload."""
+    load_routes(bridge_app, "/items")
+    result = bridge.execute_endpoint_sync("GET__items")
+    assert result == {"content": {"path": "/items"}, "status_code": 200}
+
+    load_routes(bridge_app, "/products")
+    result = bridge.execute_endpoint_sync("GET__products")
+    assert result == {"content": {"path": "/products"}, "status_code": 200}
+    assert bridge.execute_endpoint_sync("GET__items")["status_code"] == 404
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@pytest.fixture
+def dependency_calls():
+    """Record each call of the generator dependency."""
+    return []
+
+
+@pytest.fixture
+def parity_app(bridge_app, dependency_calls):
+    """App whose sync endpoints are registered through the bridge."""
+    bridge._patch_route_decorators(bridge_app)
+
+    def get_db():
+        dependency_calls.append("get_db")
+        yield "session"
+
+    @bridge_app.get("/items/{item_id}", operation_id="read_item")
+    def read_item(item_id: int, q: str = "none", db: str = Depends(get_db)):
+        return {"item_id": item_id, "q": q, "db": db}
+
+    @bridge_app.post("/items", operation_id="create_item")
+    def create_item(item: Item, db: str = Depends(get_db),
+                    same_db: str = Depends(get_db)):
+        return {"item": item, "db": db, "same_db": same_db}
+
+    @bridge_app.post("/echo", operation_id="echo_text")
+    def echo_text(text: str):
+        return {"text": text}
+
+    @bridge_app.get("/missing/{item_id}", operation_id="missing_item")
+    def missing_item(item_id: int):
+        raise HTTPException(status_code=404, detail=f"Item {item_id} not found")
+
+    return bridge_app
+
+
+@pytest.mark.parametrize("operation_id, path_params, query_params, body, body_json, expected", [
+    ("read_item", {"item_id": "3"}, {"q": "x"}, None, None,
+     {"content": {"item_id": 3, "q": "x", "db": "session"}, "status_code": 200}),
+    ("read_item", {"item_id": 4}, None, None, None,
+     {"content": {"item_id": 4, "q": "none", "db": "session"}, "status_code": 200}),
+    ("create_item", None, None, {"name": "Pen", "price": 1.5}, None,
+     {"content": {"item": {"name": "Pen", "price": 1.5}, "db": "session",
+                  "same_db": "session"}, "status_code": 200}),
+    ("create_item", None, None, None, '{"name": "Pen", "price": 1.5}',
+     {"content": {"item": {"name": "Pen", "price": 1.5}, "db": "session",
+                  "same_db": "session"}, "status_code": 200}),
+    ("echo_text", None, None, "42", None,
+     {"content": {"text": "42"}, "status_code": 200}),
+])
+def test_sync_dispatch_matches_async(parity_app, dependency_calls, operation_id,
+                                     path_params, query_params, body, body_json,
+                                     expected):
+    """Test that sync and async dispatch return the same response."""
+    assert bridge.is_sync_endpoint(operation_id)
+
+    async_result = asyncio.run(bridge.execute_endpoint(
+        operation_id, path_params, query_params, body, body_json))
+    sync_result = bridge.execute_endpoint_sync(
+        operation_id, path_params, query_params, body, body_json)
+
+    assert async_result == expected
+    assert sync_result == expected
+    # The generator dependency runs once per request, however often it's used
+    if operation_id != "echo_text":
+        assert dependency_calls == ["get_db", "get_db"]
+
+
+def test_sync_dispatch_maps_http_exception(parity_app):
+    """Test that HTTPException maps to the same error on both paths."""
+    async_result = asyncio.run(bridge.execute_endpoint("missing_item", {"item_id": 7}))
+    sync_result = bridge.execute_endpoint_sync("missing_item", {"item_id": 7})
+
+    assert sync_result == async_result
+    assert sync_result["status_code"] == 404
+    assert sync_result["content"]["error"] == "HTTPException"
+
+
+def test_sync_dispatch_unknown_endpoint(parity_app):
+    """Test that an unknown operation id is a 404 on both paths."""
+    async_result = asyncio.run(bridge.execute_endpoint("does_not_exist"))
+    sync_result = bridge.execute_endpoint_sync("does_not_exist")
+
+    assert sync_result == async_result
+    assert sync_result["status_code"] == 404
+
+
+def test_sync_dispatch_rejects_async_endpoints(parity_app):
+    """Test that handlers or dependencies needing await are not sync."""
+    async def get_user():
+        return {"name": "Demo"}
+
+    @parity_app.get("/me", operation_id="read_me")
+    def read_me(user: dict = Depends(get_user)):
+        return user
+
+    @parity_app.get("/ping", operation_id="ping")
+    async def ping():
+        return {"ok": True}
+
+    for operation_id, expected in (("read_me", {"name": "Demo"}), ("ping", {"ok": True})):
+        assert not bridge.is_sync_endpoint(operation_id)
+        assert bridge.execute_endpoint_sync(operation_id)["status_code"] == 500
+        result = asyncio.run(bridge.execute_endpoint(operation_id))
+        assert result == {"content": expected, "status_code": 200}
+
+
+def test_sync_dispatch_follows_reregistration(parity_app):
+    """Test that re-registering an operation id refreshes the sync check."""
+    @parity_app.get("/status", operation_id="status")
+    def status_v1():
+        return {"version": 1}
+
+    assert bridge.is_sync_endpoint("status")
+    assert bridge.execute_endpoint_sync("status")["content"] == {"version": 1}
+
+    @parity_app.get("/status", operation_id="status")
+    async def status_v2():
+        return {"version": 2}
+
+    assert not bridge.is_sync_endpoint("status")
+    result = asyncio.run(bridge.execute_endpoint("status"))
+    assert result["content"] == {"version": 2}
+
+
+class ValueDependency:
+    """Callable dependency that compares by value and so is unhashable."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, ValueDependency) and other.value == self.value
+
+    def __call__(self):
+        return self.value
+
+
+def test_unhashable_dependency(parity_app):
+    """Test that unhashable callable dependencies still resolve."""
+    @parity_app.get("/answer", operation_id="answer")
+    def answer(value: int = Depends(ValueDependency(42))):
+        return {"value": value}
+
+    expected = {"content": {"value": 42}, "status_code": 200}
+    assert bridge.execute_endpoint_sync("answer") == expected
+    assert asyncio.run(bridge.execute_endpoint("answer")) == expected
+    assert bridge.Depends(ValueDependency(7)).is_generator is False
+
+
+def test_dependency_kinds_are_not_kept_alive():
+    """Test that cached dependency kinds don't keep dependencies alive."""
+    def get_value():
+        yield 1
+
+    assert bridge._dependency_kind(get_value) == (False, True)
+    assert get_value in bridge._dependency_kinds
+
+    count = len(bridge._dependency_kinds)
+    del get_value
+    gc.collect()
+    assert len(bridge._dependency_kinds) == count - 1
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+def test_convert_to_serializable_values():
+    """Test conversion of common non-JSON values."""
+    value = {
+        "when": datetime(2024, 1, 2, 3, 4, 5),
+        "price": Decimal("1.50"),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "color": Color.RED,
+        "point": Point(1, 2),
+        "item": Item(name="Pen", price=1.5),
+        "tags": ("a", "b"),
+    }
+
+    assert bridge.convert_to_serializable(value) == {
+        "when": "2024-01-02T03:04:05",
+        "price": 1.5,
+        "id": "12345678-1234-5678-1234-567812345678",
+        "color": "red",
+        "point": {"x": 1, "y": 2},
+        "item": {"name": "Pen", "price": 1.5},
+        "tags": ["a", "b"],
+    }
+
+
+def test_convert_to_serializable_breaks_cycles(monkeypatch):
+    """Test that reference cycles become markers without deep recursion."""
+    author = {"name": "Alice", "posts": []}
+    author["posts"].append({"title": "Hello", "author": author})
+
+    depth = []
+    original_convert = bridge._convert
+
+    def tracking_convert(obj, seen):
+        depth.append(len(seen))
+        return original_convert(obj, seen)
+
+    monkeypatch.setattr(bridge, "_convert", tracking_convert)
+    result = bridge.convert_to_serializable(author)
+
+    assert result == {
+        "name": "Alice",
+        "posts": [{"title": "Hello", "author": "<circular>"}],
+    }
+    assert max(depth) < 10
+
+
+def test_convert_to_serializable_repeats_shared_objects():
+    """Test that an object referenced twice without a cycle is kept."""
+    shared = {"id": 1}
+    assert bridge.convert_to_serializable([shared, shared]) == [{"id": 1}, {"id": 1}]
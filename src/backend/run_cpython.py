@@ -1,14 +1,50 @@
 """
-Standalone runner for the FastAPI application using uvicorn.
+Standalone runner for the FastAPI application.
 Use this to run the backend with CPython for testing.
+
+Development runs a single auto-reloading uvicorn process. Production
+(DATABASE_URL set) hands off to gunicorn, which supervises the uvicorn
+workers; send the gunicorn master SIGHUP to reload code gracefully.
+DEV_SINGLE_PROCESS=1 or 0 overrides that choice.
+
+The choice is made here, before the app is imported, so the process
+replaced by gunicorn never builds the app or its database engine.
 """
 import sys
 import os
 
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Add the app directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "app"))
+
+
+def gunicorn_workers() -> int:
+    """Worker processes for production: 2 * CPU cores + 1."""
+    return 2 * (os.cpu_count() or 1) + 1
+
+
+def run_gunicorn() -> None:
+    """Replace this process with gunicorn running uvicorn workers."""
+    # No --threads: UvicornWorker runs its own event loop per process
+    os.execvp("gunicorn", [
+        "gunicorn", "app.app_main:app",
+        "--chdir", BACKEND_DIR,
+        "--worker-class", "uvicorn.workers.UvicornWorker",
+        "--workers", str(gunicorn_workers()),
+        "--bind", "0.0.0.0:8000",
+        "--worker-connections", "1000",
+        "--keep-alive", "5",
+    ])
+
 
 if __name__ == "__main__":
+    from app.core.runtime import get_environment
+
+    development = get_environment() == "fastapi-development"
+    if os.getenv("DEV_SINGLE_PROCESS", "1" if development else "0") != "1":
+        run_gunicorn()
+
     import uvicorn
 
     # Run the application
@@ -85,7 +85,7 @@ if not os.getcwd().endswith("/persist/api"):
 
 # Try to import the bridge module properly
 try:
-    from app.core.bridge import EnhancedFastAPIBridge, execute_endpoint, get_endpoints, get_openapi_schema
+    from app.core.bridge import EnhancedFastAPIBridge, execute_endpoint, execute_endpoint_sync, is_sync_endpoint, get_endpoints, get_openapi_schema
     # Create a global bridge instance
     bridge = EnhancedFastAPIBridge()
     print("✅ Successfully imported and created bridge from modular structure!")
@@ -110,7 +110,7 @@ except ImportError as e:
     # Fall back to executing the file directly
     exec(open("/persist/api/app/core/bridge.py").read())
     # Create bridge instance after exec
-    from app.core.bridge import EnhancedFastAPIBridge, execute_endpoint, get_endpoints, get_openapi_schema
+    from app.core.bridge import EnhancedFastAPIBridge, execute_endpoint, execute_endpoint_sync, is_sync_endpoint, get_endpoints, get_openapi_schema
     bridge = EnhancedFastAPIBridge()
     print("✅ Bridge loaded via exec fallback")
     
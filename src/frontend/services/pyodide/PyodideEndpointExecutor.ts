@@ -100,10 +100,10 @@ export class PyodideEndpointExecutor {
       ? JSON.stringify(safeQueryParams)
       : "None";
 
-    // Don't stringify the body - pass it as a Python object reference
-    // Set the body in Python globals so it can be accessed properly
+    // Send the body as JSON text: the bridge parses it in one call, which is
+    // cheaper than converting a JsProxy object graph key by key
     if (safeBody !== null) {
-      this.pyodide.globals.set("_request_body", safeBody);
+      this.pyodide.globals.set("_request_body", JSON.stringify(safeBody));
     } else {
       this.pyodide.globals.set("_request_body", null);
     }
@@ -111,7 +111,7 @@ export class PyodideEndpointExecutor {
     const result = (await this.pyodide.runPythonAsync(`
 import json
 
-# Get the body from globals (already converted to Python object by Pyodide)
+# Get the body from globals (JSON text, parsed by the bridge via body_json)
 request_body = globals().get('_request_body', None)
 
 # Debug: Print what we received
@@ -120,13 +120,21 @@ print(" Python received pathParams:", ${pathParamsStr})
 print(" Python received queryParams:", ${queryParamsStr})
 print(f" Python received body: {request_body} (type: {type(request_body)})")
 
-# Call the endpoint executor
-result = await execute_endpoint(
-    "${operationId}",
-    ${pathParamsStr},
-    ${queryParamsStr},
-    request_body
-)
+# Call the endpoint executor, skipping the event loop for sync handlers
+if is_sync_endpoint("${operationId}"):
+    result = execute_endpoint_sync(
+        "${operationId}",
+        ${pathParamsStr},
+        ${queryParamsStr},
+        body_json=request_body
+    )
+else:
+    result = await execute_endpoint(
+        "${operationId}",
+        ${pathParamsStr},
+        ${queryParamsStr},
+        body_json=request_body
+    )
 result
 `)) as PyodideObject;
 